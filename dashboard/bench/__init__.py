@@ -0,0 +1,6 @@
+"""Benchmarks for the strategy dashboard.
+
+``generate.py`` builds synthetic strategy trees and ``run.py`` measures
+scanning, parsing, serialization and the HTTP API against one, writing
+JSON results that can be compared between commits.
+"""
@@ -0,0 +1,236 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = []
+# ///
+"""
+Synthetic strategy tree generator
+
+Builds N projects x M epics x K tasks per epic, each project with a
+VISION.md and OKRs.md, laid out like the files the /ai-dev commands write.
+Output is deterministic for a given seed.
+
+Usage:
+    uv run python dashboard/bench/generate.py /tmp/strategy-tree
+    uv run python dashboard/bench/generate.py /tmp/strategy-tree -p 20 -e 20 -t 30 --body 8
+"""
+
+import argparse
+import random
+import shutil
+from pathlib import Path
+
+EPIC_STATUSES = ["Not Started", "In Progress", "Done"]
+TASK_STATUSES = ["Todo", "In Progress", "Done"]
+TASK_SIZES = ["S", "M", "L", "XL"]
+PRIORITIES = ["P0", "P1", "P2"]
+
+WORDS = (
+    "customer onboarding latency dashboard metric release pipeline review "
+    "migration schema cache index search report export import billing invoice "
+    "account session token retry queue worker backlog roadmap milestone "
+    "experiment rollout feedback adoption churn retention growth signal "
+    "alert incident runbook deploy staging production config feature flag"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    """Return a pseudo-random sentence of vocabulary words."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def paragraphs(rng: random.Random, count: int) -> str:
+    """Return ``count`` filler paragraphs separated by blank lines."""
+    return "\n\n".join(
+        " ".join(sentence(rng) for _ in range(4)) for _ in range(count)
+    )
+
+
+def bullets(rng: random.Random, count: int) -> str:
+    return "\n".join(f"- {sentence(rng, 8)}" for _ in range(count))
+
+
+def write(path: Path, text: str) -> int:
+    """Write a file and return its size in bytes."""
+    data = text.encode("utf-8")
+    path.write_bytes(data)
+    return len(data)
+
+
+def vision_markdown(rng: random.Random, name: str) -> str:
+    bets = "\n".join(f"{i}. {sentence(rng, 10)}" for i in range(1, 4))
+    return f"""# North Star, Vision & Mission
+
+## Problem Context
+{sentence(rng, 20)}
+
+## North Star
+{sentence(rng, 10)}
+
+## Vision (3-5 Years)
+{sentence(rng, 25)}
+{sentence(rng, 25)}
+
+## Mission
+{bullets(rng, 3)}
+
+## Strategic Bets
+{bets}
+
+## Non-Goals
+{bullets(rng, 2)}
+
+## Success Metrics
+{bullets(rng, 3)}
+
+---
+*Created for {name}*
+"""
+
+
+def okrs_markdown(rng: random.Random, objectives: int = 3) -> str:
+    parts = ["# OKRs for Q1\n\n## Connection to North Star\n" + sentence(rng) + "\n"]
+    for number in range(1, objectives + 1):
+        key_results = "\n".join(
+            f"- **KR{kr}:** {sentence(rng, 8)}\n  Measurement: {sentence(rng, 6)}"
+            for kr in range(1, 4)
+        )
+        parts.append(
+            f"---\n\n## Objective {number} — {sentence(rng, 5)}\n\n"
+            f"**Intent:** {sentence(rng, 10)}\n\n### Key Results:\n{key_results}\n\n"
+            f"**Confidence:** {rng.randint(3, 9)}/10\n"
+        )
+    parts.append("---\n\n## OKR Summary\n\n| Objective | KR1 |\n|---|---|\n")
+    return "\n".join(parts)
+
+
+def epic_markdown(
+    rng: random.Random, epic_id: str, tasks: list[tuple[str, str]], body: int
+) -> str:
+    task_lines = "\n".join(
+        f"- [{'x' if status == 'Done' else ' '}] [{task_id}](../tasks/{task_id}.md)"
+        for task_id, status in tasks
+    )
+    return f"""# Epic: {sentence(rng, 5).rstrip('.')}
+
+## Status
+
+`{rng.choice(EPIC_STATUSES)}`
+
+## Description
+
+{paragraphs(rng, body)}
+
+## Dependencies
+
+**Priority:** `{rng.choice(PRIORITIES)}`
+**Blocked by:** none
+
+## Tasks
+
+{task_lines}
+
+## Acceptance Criteria
+
+- [ ] {sentence(rng, 8)}
+- [ ] {sentence(rng, 8)}
+"""
+
+
+def task_markdown(
+    rng: random.Random, epic_id: str, epic_title: str, status: str, body: int
+) -> str:
+    return f"""# Task: {sentence(rng, 6).rstrip('.')}
+
+**Status:** `{status}`
+**Size:** `{rng.choice(TASK_SIZES)}`
+**Epic:** [{epic_title}](../epics/{epic_id}.md)
+
+## Description
+
+{paragraphs(rng, body)}
+
+## Acceptance Criteria
+
+- [ ] {sentence(rng, 8)}
+- [ ] {sentence(rng, 8)}
+"""
+
+
+def generate_tree(
+    root: Path,
+    projects: int = 5,
+    epics: int = 10,
+    tasks: int = 10,
+    body: int = 3,
+    seed: int = 0,
+) -> dict[str, int]:
+    """Write a synthetic tree of strategy files under root.
+
+    ``epics`` is per project, ``tasks`` per epic and ``body`` the number of
+    filler paragraphs in each epic and task description. Returns the number
+    of projects, epics, tasks and bytes written.
+    """
+    rng = random.Random(seed)
+    written = 0
+    for p in range(projects):
+        name = f"project-{p:03d}"
+        strategy = root / name / "strategy"
+        (strategy / "epics").mkdir(parents=True, exist_ok=True)
+        (strategy / "tasks").mkdir(parents=True, exist_ok=True)
+        written += write(strategy / "VISION.md", vision_markdown(rng, name))
+        written += write(strategy / "OKRs.md", okrs_markdown(rng))
+
+        for e in range(epics):
+            epic_id = f"epic-{e:03d}"
+            epic_title = f"Epic {e}"
+            epic_tasks = []
+            for t in range(tasks):
+                task_id = f"{epic_id}-task-{t:03d}"
+                status = rng.choice(TASK_STATUSES)
+                epic_tasks.append((task_id, status))
+                written += write(
+                    strategy / "tasks" / f"{task_id}.md",
+                    task_markdown(rng, epic_id, epic_title, status, body),
+                )
+            written += write(
+                strategy / "epics" / f"{epic_id}.md",
+                epic_markdown(rng, epic_id, epic_tasks, body),
+            )
+
+    return {
+        "projects": projects,
+        "epics": projects * epics,
+        "tasks": projects * epics * tasks,
+        "bytes": written,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic strategy tree")
+    parser.add_argument("root", type=Path, help="Directory to write projects into")
+    parser.add_argument("-p", "--projects", type=int, default=5, help="Number of projects")
+    parser.add_argument("-e", "--epics", type=int, default=10, help="Epics per project")
+    parser.add_argument("-t", "--tasks", type=int, default=10, help="Tasks per epic")
+    parser.add_argument(
+        "--body", type=int, default=3, help="Filler paragraphs per epic/task (file size)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--clean", action="store_true", help="Remove root before generating"
+    )
+    args = parser.parse_args()
+
+    if args.clean and args.root.exists():
+        shutil.rmtree(args.root)
+    stats = generate_tree(
+        args.root, args.projects, args.epics, args.tasks, args.body, args.seed
+    )
+    print(
+        f"Wrote {stats['projects']} projects, {stats['epics']} epics, "
+        f"{stats['tasks']} tasks ({stats['bytes'] / 1e6:.1f} MB) to {args.root}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = []
+# ///
+"""
+Strategy Dashboard Benchmarks
+
+Measures cold and warm scans, per-file parse throughput, snapshot
+serialization and /api/data latency and throughput against a local server,
+on a synthetic tree (or an existing one with --tree). Results are written
+as JSON so runs on different commits can be compared with --compare.
+
+Usage:
+    uv run python dashboard/bench/run.py
+    uv run python dashboard/bench/run.py -p 20 -e 20 -t 30 --output before.json
+    uv run python dashboard/bench/run.py -p 20 -e 20 -t 30 --compare before.json
+    uv run python dashboard/bench/run.py --only cold_scan,warm_scan --tree ~/Code
+
+Everything runs offline; the server is started on a free localhost port.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+DASHBOARD_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DASHBOARD_DIR))
+
+from generate import generate_tree  # noqa: E402
+from parser import (  # noqa: E402
+    evict_stale,
+    list_project_files,
+    parse_epic,
+    parse_okrs,
+    parse_task,
+    parse_vision,
+    scan_all_projects,
+)
+from snapshot import build_aggregates, encode_snapshot  # noqa: E402
+
+BENCHMARKS = ["cold_scan", "warm_scan", "parse", "serialize", "api_data"]
+RESULTS_FORMAT = 1
+SERVER_START_TIMEOUT = 120  # seconds
+REGRESSION_THRESHOLD = 0.10  # relative change reported as a regression
+
+
+def summarize(samples: list[float], unit: str, better: str = "lower") -> dict:
+    """Summary statistics of one metric; ``better`` says which direction wins."""
+    ordered = sorted(samples)
+    return {
+        "unit": unit,
+        "better": better,
+        "median": statistics.median(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "samples": len(ordered),
+    }
+
+
+def timed(fn, repeat: int, setup=None) -> list[float]:
+    """Run fn ``repeat`` times and return the wall-clock durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def discover_projects(tree: Path) -> list[str]:
+    return sorted(
+        item.name for item in tree.iterdir() if (item / "strategy").is_dir()
+    )
+
+
+def bench_scans(tree: Path, names: list[str], args) -> dict:
+    """Full scans with an empty parse cache (cold) and an unchanged tree (warm)."""
+    def scan():
+        scan_all_projects(tree, names, args.workers, args.processes)
+
+    results = {}
+    if "cold_scan" in args.only:
+        results["cold_scan"] = summarize(
+            timed(scan, args.repeat, setup=lambda: evict_stale(set())), "s"
+        )
+    if "warm_scan" in args.only:
+        scan()
+        results["warm_scan"] = summarize(timed(scan, args.repeat), "s")
+    return results
+
+
+def bench_parse(tree: Path, names: list[str], args) -> dict:
+    """Per-file throughput of each parse_* function, without the parse cache."""
+    files: dict[str, list[Path]] = {"vision": [], "okrs": [], "epic": [], "task": []}
+    for name in names:
+        for kind, file_path, _ in list_project_files(tree / name):
+            files[kind].append(file_path)
+
+    parsers = {
+        "epic": lambda path: parse_epic(path, "bench"),
+        "task": lambda path: parse_task(path, "bench"),
+        "vision": parse_vision,
+        "okrs": parse_okrs,
+    }
+    results = {}
+    for kind, paths in files.items():
+        if not paths:
+            continue
+        parse = parsers[kind]
+        total_bytes = sum(path.stat().st_size for path in paths)
+        durations = timed(lambda: [parse(path) for path in paths], args.repeat)
+        results[f"parse_{kind}"] = summarize(
+            [len(paths) / duration for duration in durations], "files/s", "higher"
+        )
+        results[f"parse_{kind}_bytes"] = summarize(
+            [total_bytes / 1e6 / duration for duration in durations], "MB/s", "higher"
+        )
+    return results
+
+
+def bench_serialize(tree: Path, names: list[str], args) -> dict:
+    """Time to aggregate and encode one snapshot as served by /api/data."""
+    projects, epics, tasks = scan_all_projects(tree, names, args.workers)
+    data = {}
+
+    def build():
+        data.clear()
+        data.update(
+            {
+                "projects": projects,
+                "epics": epics,
+                "tasks": tasks,
+                "refreshedAt": datetime.now(timezone.utc).isoformat(),
+                "version": 1,
+            }
+        )
+        data.update(build_aggregates(epics, tasks))
+
+    encoded = {}
+    results = {
+        "aggregate": summarize(timed(build, args.repeat), "s"),
+        "serialize": summarize(
+            timed(lambda: encoded.update(encode_snapshot(data)), args.repeat), "s"
+        ),
+    }
+    results["snapshot_bytes"] = summarize([len(encoded["body"])], "bytes")
+    results["snapshot_gzip_bytes"] = summarize([len(encoded["gzip"])], "bytes")
+    return results
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def fetch(port: int, path: str, headers: dict | None = None) -> http.client.HTTPResponse:
+    """GET a path on the local server and read the whole response."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        conn.request("GET", path, headers=headers or {})
+        response = conn.getresponse()
+        response.read()
+        return response
+    finally:
+        conn.close()
+
+
+def start_server(tree: Path, names: list[str], args) -> tuple[subprocess.Popen, int]:
+    """Start server.py on a free port and wait until it answers."""
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(DASHBOARD_DIR / "server.py"),
+            "--dir", str(tree),
+            "--projects", ",".join(names),
+            "--port", str(port),
+            "--workers", str(args.workers),
+            "--no-snapshot",
+            "--no-history",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + SERVER_START_TIMEOUT
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with status {process.returncode}")
+        try:
+            fetch(port, "/api/projects")
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("server did not start in time")
+
+
+def bench_api_data(tree: Path, names: list[str], args) -> dict:
+    """Latency of sequential /api/data requests and throughput under concurrency."""
+    process, port = start_server(tree, names, args)
+    try:
+        etag = fetch(port, "/api/data").getheader("ETag")
+
+        variants = {
+            "api_data_latency": {},
+            "api_data_gzip_latency": {"Accept-Encoding": "gzip"},
+            "api_data_304_latency": {"If-None-Match": etag or ""},
+        }
+        results = {}
+        for name, headers in variants.items():
+            durations = timed(lambda: fetch(port, "/api/data", headers), args.requests)
+            results[name] = summarize([d * 1000 for d in durations], "ms")
+
+        # Throughput: args.concurrency clients sharing args.requests requests
+        remaining = [args.requests]
+        lock = threading.Lock()
+        errors = []
+
+        def client():
+            while True:
+                with lock:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                try:
+                    fetch(port, "/api/data", {"Accept-Encoding": "gzip"})
+                except OSError as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=client) for _ in range(args.concurrency)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results["api_data_throughput"] = summarize(
+            [(args.requests - len(errors)) / elapsed], "req/s", "higher"
+        )
+        results["api_data_errors"] = summarize([len(errors)], "count")
+        return results
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def git_revision() -> dict:
+    """Commit and dirty flag of the checkout being benchmarked, if available."""
+    def git(*command: str) -> str:
+        return subprocess.run(
+            ["git", *command],
+            cwd=DASHBOARD_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def compare(old: dict, new: dict, threshold: float) -> list[str]:
+    """Print metric changes between two result files; return regressed metric names."""
+    regressions = []
+    print(f"\n{'metric':<28}{'before':>14}{'after':>14}{'change':>10}")
+    for name, metric in new["results"].items():
+        before = old.get("results", {}).get(name)
+        if not before or not before["median"]:
+            continue
+        change = metric["median"] / before["median"] - 1
+        worse = change > threshold if metric["better"] == "lower" else change < -threshold
+        if worse and metric["unit"] not in ("bytes", "count"):
+            regressions.append(name)
+        flag = "  <-- regression" if name in regressions else ""
+        print(
+            f"{name:<28}{before['median']:>14.4g}{metric['median']:>14.4g}"
+            f"{change:>+10.1%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Strategy Dashboard Benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"Benchmarks: {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument("--tree", type=Path, help="Benchmark an existing projects directory")
+    parser.add_argument("-p", "--projects", type=int, default=10, help="Synthetic projects")
+    parser.add_argument("-e", "--epics", type=int, default=10, help="Epics per project")
+    parser.add_argument("-t", "--tasks", type=int, default=10, help="Tasks per epic")
+    parser.add_argument("--body", type=int, default=3, help="Filler paragraphs per file")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scan/parse benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="HTTP requests per variant")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent HTTP clients")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Scan workers")
+    parser.add_argument("--processes", action="store_true", help="Parse in worker processes")
+    parser.add_argument("--only", help="Comma-separated benchmarks to run")
+    parser.add_argument("-o", "--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Results JSON to compare against")
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help=f"Exit 1 if a metric is >{REGRESSION_THRESHOLD * 100:.0f}%% worse than --compare",
+    )
+    args = parser.parse_args()
+    args.only = set(args.only.split(",")) if args.only else set(BENCHMARKS)
+    unknown = args.only - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory(prefix="dashboard-bench-") as tmp:
+        if args.tree:
+            tree = args.tree.expanduser().resolve()
+            tree_info = {"path": str(tree)}
+        else:
+            tree = Path(tmp)
+            tree_info = generate_tree(
+                tree, args.projects, args.epics, args.tasks, args.body, args.seed
+            )
+            tree_info["seed"] = args.seed
+        names = discover_projects(tree)
+        print(f"Benchmarking {len(names)} projects in {tree}")
+
+        results = {}
+        steps = [
+            ({"cold_scan", "warm_scan"}, bench_scans),
+            ({"parse"}, bench_parse),
+            ({"serialize"}, bench_serialize),
+            ({"api_data"}, bench_api_data),
+        ]
+        for selected, bench in steps:
+            if selected & args.only:
+                step_results = bench(tree, names, args)
+                results.update(step_results)
+                for name, metric in step_results.items():
+                    print(f"  {name:<26}{metric['median']:>12.4g} {metric['unit']}")
+
+    report = {
+        "format": RESULTS_FORMAT,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "tree": tree_info,
+            "options": {
+                "repeat": args.repeat,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "workers": args.workers,
+                "processes": args.processes,
+            },
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        regressions = compare(
+            json.loads(args.compare.read_text()), report, REGRESSION_THRESHOLD
+        )
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Recursive discovery of projects (directories with a strategy/ folder)."""
+
+import os
+import re
+from fnmatch import translate
+
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_IGNORE = (".*", "node_modules", "__pycache__", "venv", "site-packages")
+
+# A listed directory: (st_mtime_ns, has a strategy/ folder, subdirectory names)
+DirListing = tuple[int, bool, list[str]]
+
+
+class ProjectDiscovery:
+    """Finds projects up to ``max_depth`` levels below a root directory.
+
+    Every directory visited is remembered with its mtime and subdirectories.
+    Creating, removing or renaming an entry changes its parent's mtime, so a
+    rediscovery re-lists only directories whose mtime changed and otherwise
+    costs one stat per directory. Projects are not descended into, and
+    directories matching an ignore pattern are skipped.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        ignore: tuple[str, ...] = DEFAULT_IGNORE,
+    ):
+        self.root = os.fspath(root)
+        self.max_depth = max_depth
+        self.ignore = re.compile("|".join(translate(pattern) for pattern in ignore) or "(?!)")
+        # directory path -> listing as of its last scandir
+        self._dirs: dict[str, DirListing] = {}
+
+    def list_dir(self, path: str) -> DirListing | None:
+        """Return the directory's listing, re-reading it only if its mtime changed."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._dirs.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached
+
+        has_strategy = False
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    if entry.name == "strategy":
+                        has_strategy = True
+                    elif not self.ignore.match(entry.name):
+                        subdirs.append(entry.name)
+        except OSError:
+            return None
+        listing = (mtime, has_strategy, sorted(subdirs))
+        self._dirs[path] = listing
+        return listing
+
+    def discover(self) -> list[str]:
+        """Return project paths relative to the root ("repo", "org/repo"), sorted."""
+        projects: list[str] = []
+        visited: set[str] = set()
+        # (absolute path, path relative to root, depth)
+        stack = [(self.root, "", 0)]
+        while stack:
+            path, relative, depth = stack.pop()
+            listing = self.list_dir(path)
+            if listing is None:
+                continue
+            visited.add(path)
+            _, has_strategy, subdirs = listing
+            if has_strategy and depth > 0:
+                projects.append(relative)
+                continue
+            if depth < self.max_depth:
+                for name in subdirs:
+                    child_relative = f"{relative}/{name}" if relative else name
+                    stack.append((os.path.join(path, name), child_relative, depth + 1))
+
+        # Forget directories that were removed or fell out of reach
+        for path in [path for path in self._dirs if path not in visited]:
+            del self._dirs[path]
+        return sorted(projects)
@@ -0,0 +1,237 @@
+"""Static export of the dashboard: index.html plus precomputed JSON files."""
+
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from snapshot import build_aggregates, serialize_snapshot
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = 1
+SHARD_DIR = "projects"
+DETAILS_DIR = "details"
+# Exported files are compressed once and served many times
+EXPORT_GZIP_LEVEL = 9
+# Tells index.html to load this file instead of querying the /api endpoints
+STATIC_DATA_META = '<meta name="dashboard-data" content="data.json">'
+
+
+def load_manifest(out_dir: Path) -> dict[str, Any]:
+    """Return the manifest of the previous export to out_dir, or an empty one."""
+    try:
+        manifest = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("format") == MANIFEST_FORMAT else {}
+
+
+def shard_path(project_id: str) -> str:
+    """Relative path of a project's shard ("org/repo" -> "projects/org/repo.json")."""
+    return f"{SHARD_DIR}/{project_id}.json"
+
+
+def details_path(project_id: str) -> str:
+    """Relative path of a project's vision and OKRs, as /api/projects/<id> returns them."""
+    return f"{DETAILS_DIR}/{project_id}.json"
+
+
+def build_shard(project: Any, epics: list, tasks: list, aggregates: dict) -> dict[str, Any]:
+    """Slice one project's rows and aggregates out of a snapshot."""
+    project_id = project.id
+    return {
+        "project": project,
+        "epics": epics,
+        "tasks": tasks,
+        "epic_tasks": aggregates["epic_tasks"].get(project_id, {}),
+        "counts": {
+            "project": aggregates["counts"]["projects"].get(project_id, {}),
+            "epics": aggregates["counts"]["epics"].get(project_id, {}),
+        },
+    }
+
+
+def encode_shard(shard: dict[str, Any]) -> bytes:
+    """Encode a shard as compact JSON, writing its rows with to_json."""
+    project = shard["project"].to_json()
+    rest = serialize_snapshot({key: value for key, value in shard.items() if key != "project"})
+    return f'{{"project":{project},{rest[1:]}'.encode("utf-8")
+
+
+def digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Replace a file in one step so a static server never sees it half-written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+class Exporter:
+    """Writes one export, skipping files whose content is unchanged.
+
+    A file is rewritten only when its SHA-256 differs from the one recorded
+    in the previous manifest (or it went missing), so unchanged files keep
+    their mtime and sync tools upload only what changed.
+    """
+
+    def __init__(self, out_dir: Path, previous: dict[str, Any], compress: bool):
+        self.out_dir = out_dir
+        self.previous_files: dict[str, str] = previous.get("files", {})
+        self.compress = compress
+        # relative path -> SHA-256 of everything in this export
+        self.files: dict[str, str] = {}
+        self.written: list[str] = []
+
+    def keep_previous(self, relative: str) -> bool:
+        """Keep a file from the previous export as is, without regenerating it."""
+        names = [relative, relative + ".gz"] if self.compress else [relative]
+        return all([self.keep(name, self.previous_files.get(name)) for name in names])
+
+    def put(self, relative: str, content: bytes) -> None:
+        """Write a file (and its .gz variant) unless an identical one is in place."""
+        unchanged = self.keep(relative, digest(content))
+        if not unchanged:
+            write_atomic(self.out_dir / relative, content)
+            self.written.append(relative)
+        if not self.compress:
+            return
+        name = relative + ".gz"
+        # gzip output is deterministic (mtime=0), so an unchanged file's
+        # variant is reused without compressing it again
+        if unchanged and self.keep(name, self.previous_files.get(name)):
+            return
+        compressed = gzip.compress(content, compresslevel=EXPORT_GZIP_LEVEL, mtime=0)
+        if not self.keep(name, digest(compressed)):
+            write_atomic(self.out_dir / name, compressed)
+            self.written.append(name)
+
+    def keep(self, name: str, sha: str | None) -> bool:
+        """Record a file's hash; True if the previous export left it in place."""
+        if sha is None:
+            return False
+        self.files[name] = sha
+        return self.previous_files.get(name) == sha and (self.out_dir / name).is_file()
+
+    def remove_stale(self) -> list[str]:
+        """Delete files of the previous export that this one no longer has."""
+        removed = []
+        for name in self.previous_files:
+            if name in self.files:
+                continue
+            path = self.out_dir / name
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            removed.append(name)
+            # Drop shard directories left empty ("projects/org/")
+            parent = path.parent
+            while parent != self.out_dir:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+        return removed
+
+
+def export_dashboard(
+    out_dir: Path,
+    projects: list,
+    epics: list,
+    tasks: list,
+    index_html: bytes,
+    load_details: Callable[[Any], Any],
+    shards: bool = False,
+    compress: bool = False,
+) -> dict[str, Any]:
+    """Write index.html, data.json and optionally per-project shards to out_dir.
+
+    data.json has the same shape as /api/data. Each project with a vision
+    or OKRs gets details/<id>.json, built with ``load_details`` only when
+    the project's details_version differs from the previous export. Its version is bumped, and
+    refreshedAt set, only when the exported rows changed since the last
+    export, which is recorded in manifest.json. Returns a summary with the
+    files written and removed.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(out_dir)
+    exporter = Exporter(out_dir, previous, compress)
+
+    aggregates = build_aggregates(epics, tasks)
+    content = {"projects": projects, "epics": epics, "tasks": tasks, **aggregates}
+    rows_body = serialize_snapshot(content)
+    content_digest = digest(rows_body.encode("utf-8"))
+    changed = content_digest != previous.get("digest")
+    version = previous.get("version", 0) + 1 if changed else previous["version"]
+    refreshed_at = (
+        datetime.now(timezone.utc).isoformat() if changed else previous["refreshedAt"]
+    )
+    # Splice version and refreshedAt in front of the rows rather than
+    # serializing the snapshot a second time
+    header = json.dumps({"version": version, "refreshedAt": refreshed_at}, separators=(",", ":"))
+    exporter.put("data.json", f"{header[:-1]},{rows_body[1:]}".encode("utf-8"))
+
+    shard_index = {}
+    if shards:
+        epics_by_project: dict[str, list] = {}
+        tasks_by_project: dict[str, list] = {}
+        for epic in epics:
+            epics_by_project.setdefault(epic.project, []).append(epic)
+        for task in tasks:
+            tasks_by_project.setdefault(task.project, []).append(task)
+        for project in projects:
+            shard = build_shard(
+                project,
+                epics_by_project.get(project.id, []),
+                tasks_by_project.get(project.id, []),
+                aggregates,
+            )
+            shard_index[project.id] = shard_path(project.id)
+            exporter.put(shard_index[project.id], encode_shard(shard))
+
+    details_index = {}
+    previous_details = previous.get("details", {})
+    for project in projects:
+        if not project.details_version:
+            continue
+        details_index[project.id] = project.details_version
+        relative = details_path(project.id)
+        if previous_details.get(project.id) == project.details_version:
+            if exporter.keep_previous(relative):
+                continue
+        details = load_details(project).to_dict()
+        exporter.put(relative, json.dumps(details, separators=(",", ":")).encode("utf-8"))
+
+    meta = STATIC_DATA_META.encode("utf-8")
+    if meta not in index_html:
+        index_html = index_html.replace(b"<head>", b"<head>\n    " + meta, 1)
+    exporter.put("index.html", index_html)
+
+    removed = exporter.remove_stale()
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": version,
+        "refreshedAt": refreshed_at,
+        "exportedAt": datetime.now(timezone.utc).isoformat(),
+        "digest": content_digest,
+        "shards": shard_index,
+        "details": details_index,
+        "files": exporter.files,
+    }
+    write_atomic(out_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8"))
+    return {
+        "version": version,
+        "changed": changed,
+        "written": exporter.written,
+        "removed": removed,
+        "files": len(exporter.files),
+    }
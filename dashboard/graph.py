@@ -0,0 +1,151 @@
+"""Epic <-> task link graph per project, with the inconsistencies it reveals."""
+
+from collections import defaultdict
+from typing import Any
+
+from models import Epic, Task
+
+
+def build_project_graph(project: str, epics: list[Epic], tasks: list[Task]) -> dict[str, Any]:
+    """Resolve one project's epic checklists and task epic links into a graph.
+
+    ``epics`` maps each epic to the tasks its checklist lists and the tasks
+    linking to it; ``tasks`` maps each task to its epic and the epics listing
+    it. ``issues`` holds:
+
+    - status_mismatches: checklist entries whose box disagrees with the
+      task's status (checked but not done, or done but unchecked)
+    - epic_mismatches: tasks listed by an epic other than the one they
+      link to
+    - orphan_tasks: tasks whose epic does not exist and that no epic lists
+    - dangling_links: checklist entries naming a missing task, and task
+      epic links naming a missing epic
+    """
+    epics_by_id = {epic.id: epic for epic in epics}
+    tasks_by_id = {task.id: task for task in tasks}
+    listed_in: dict[str, list[str]] = defaultdict(list)
+    linked_tasks: dict[str, list[str]] = defaultdict(list)
+    status_mismatches = []
+    dangling_links = []
+
+    for epic in epics:
+        for task_id, checked in epic.task_links:
+            task = tasks_by_id.get(task_id)
+            if task is None:
+                dangling_links.append({"from": "epic", "epic": epic.id, "task": task_id})
+                continue
+            listed_in[task_id].append(epic.id)
+            if checked != (task.state == "done"):
+                status_mismatches.append(
+                    {
+                        "epic": epic.id,
+                        "task": task_id,
+                        "checked": checked,
+                        "task_status": task.status,
+                    }
+                )
+
+    epic_mismatches = []
+    orphan_tasks = []
+    for task in tasks:
+        listing = listed_in.get(task.id, [])
+        if task.epic_id in epics_by_id:
+            linked_tasks[task.epic_id].append(task.id)
+            if listing and task.epic_id not in listing:
+                epic_mismatches.append(
+                    {"task": task.id, "epic": task.epic_id, "listed_in": listing}
+                )
+            continue
+        if task.epic_linked:
+            dangling_links.append({"from": "task", "epic": task.epic_id, "task": task.id})
+        if not listing:
+            orphan_tasks.append({"task": task.id, "epic": task.epic_id})
+
+    issues = {
+        "status_mismatches": status_mismatches,
+        "epic_mismatches": epic_mismatches,
+        "orphan_tasks": orphan_tasks,
+        "dangling_links": dangling_links,
+    }
+    return {
+        "project": project,
+        "epics": {
+            epic.id: {
+                "tasks": [task_id for task_id, _ in epic.task_links],
+                "linked_tasks": linked_tasks.get(epic.id, []),
+            }
+            for epic in epics
+        },
+        "tasks": {
+            task.id: {
+                "epic": task.epic_id if task.epic_id in epics_by_id else None,
+                "listed_in": listed_in.get(task.id, []),
+            }
+            for task in tasks
+        },
+        "issues": issues,
+        "issue_counts": {kind: len(found) for kind, found in issues.items()},
+    }
+
+
+def changed_projects(changes: dict[str, Any]) -> set[str]:
+    """Return the ids of projects with an epic or task added, updated or removed."""
+    projects = set()
+    for kind in ("epics", "tasks"):
+        delta = changes[kind]
+        for row in delta["added"] + delta["updated"]:
+            projects.add(row.project)
+        for key in delta["removed"]:
+            projects.add(key["project"])
+    return projects
+
+
+class LinkGraph:
+    """Link graphs of every project in one snapshot.
+
+    A LinkGraph is never modified once built. ``update`` returns a new one
+    that rebuilds only the graphs of projects whose epics or tasks changed
+    and shares the others.
+    """
+
+    def __init__(self, projects: dict[str, dict[str, Any]] | None = None):
+        self.projects: dict[str, dict[str, Any]] = projects or {}
+
+    def update(self, data: dict[str, Any], changes: dict[str, Any] | None) -> "LinkGraph":
+        """Return the graphs of a snapshot, reusing this one's for unchanged projects.
+
+        ``changes`` is the diff from the previous snapshot, or None to
+        rebuild every graph.
+        """
+        project_ids = [project.id for project in data["projects"]]
+        if changes is None:
+            stale = set(project_ids)
+        else:
+            stale = changed_projects(changes) | (set(project_ids) - set(self.projects))
+        epics: dict[str, list[Epic]] = defaultdict(list)
+        tasks: dict[str, list[Task]] = defaultdict(list)
+        for epic in data["epics"]:
+            if epic.project in stale:
+                epics[epic.project].append(epic)
+        for task in data["tasks"]:
+            if task.project in stale:
+                tasks[task.project].append(task)
+
+        graphs = {}
+        for project in project_ids:
+            if project in stale:
+                graphs[project] = build_project_graph(project, epics[project], tasks[project])
+            else:
+                graphs[project] = self.projects[project]
+        return LinkGraph(graphs)
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Return each project's issue counts and issues, without the edges."""
+        return [
+            {
+                "project": graph["project"],
+                "issue_counts": graph["issue_counts"],
+                "issues": graph["issues"],
+            }
+            for graph in self.projects.values()
+        ]
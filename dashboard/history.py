@@ -0,0 +1,188 @@
+"""Time series of per-project and per-epic status and size counts."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# (age, resolution): samples older than age keep one per resolution-second
+# bucket, i.e. per scan for a day, hourly for a month and daily after that
+DOWNSAMPLE_TIERS = ((24 * 3600, 3600), (30 * 24 * 3600, 24 * 3600))
+DOWNSAMPLE_INTERVAL = 3600  # seconds between downsampling passes
+
+# One row per (project, epic) whenever its counts change. project "" holds
+# the totals over all projects and epic "" a project's totals; counts "{}"
+# marks a project or epic that disappeared.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    project TEXT NOT NULL,
+    epic TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    counts TEXT NOT NULL,
+    PRIMARY KEY (project, epic, ts)
+) WITHOUT ROWID;
+"""
+
+SeriesKey = tuple[str, str]
+
+
+def default_history_path(projects_dir: Path) -> Path:
+    """Return the history file used for a projects directory by default."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    digest = hashlib.sha1(str(projects_dir).encode("utf-8")).hexdigest()[:12]
+    return cache_home / "strategy-dashboard" / f"history-{digest}.sqlite3"
+
+
+def flatten_counts(counts: dict[str, Any]) -> dict[SeriesKey, str]:
+    """Map a snapshot's aggregate counts to {(project, epic): compact JSON}."""
+    def encode(value: dict) -> str:
+        return json.dumps(value, separators=(",", ":"), sort_keys=True)
+
+    series = {("", ""): encode(counts["global"])}
+    for project, project_counts in counts["projects"].items():
+        series[(project, "")] = encode(project_counts)
+    for project, epics in counts["epics"].items():
+        for epic, epic_counts in epics.items():
+            series[(project, epic)] = encode(epic_counts)
+    return series
+
+
+def parse_timestamp(value: str) -> int:
+    """Parse unix seconds or an ISO 8601 time (UTC unless it has an offset)."""
+    if value.lstrip("-").isdigit():
+        return int(value)
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+class HistoryStore:
+    """Append-only SQLite file of count samples, thinned as they age.
+
+    A sample is written only when a series' counts differ from its previous
+    sample, so the counts at any time are those of the latest sample at or
+    before it. Range queries are index seeks on (project, epic, ts).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        # (project, epic) -> counts of its latest sample; loaded on first record
+        self._last: dict[SeriesKey, str] | None = None
+        self._downsampled_at = 0.0
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        # Readers never wait for the scan appending a sample
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def load_last(self, conn: sqlite3.Connection) -> dict[SeriesKey, str]:
+        # SQLite returns the other columns from the row holding max(ts)
+        rows = conn.execute(
+            "SELECT project, epic, counts, max(ts) FROM samples GROUP BY project, epic"
+        )
+        return {(project, epic): counts for project, epic, counts, _ in rows}
+
+    def record(self, counts: dict[str, Any], now: float | None = None) -> int:
+        """Append samples for the series whose counts changed; return how many."""
+        now = time.time() if now is None else now
+        current = flatten_counts(counts)
+        with self.lock:
+            try:
+                with closing(self.connect()) as conn, conn:
+                    if self._last is None:
+                        self._last = self.load_last(conn)
+                    rows = [
+                        (project, epic, int(now), 0, value)
+                        for (project, epic), value in current.items()
+                        if self._last.get((project, epic)) != value
+                    ]
+                    rows.extend(
+                        (project, epic, int(now), 0, "{}")
+                        for (project, epic), value in self._last.items()
+                        if (project, epic) not in current and value != "{}"
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO samples (project, epic, ts, resolution, counts) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    if now - self._downsampled_at >= DOWNSAMPLE_INTERVAL:
+                        self.downsample(conn, now)
+                        self._downsampled_at = now
+            except sqlite3.Error as e:
+                print(f"Warning: could not record history to {self.path}: {e}")
+                return 0
+            for project, epic, _, _, value in rows:
+                self._last[(project, epic)] = value
+        return len(rows)
+
+    def downsample(self, conn: sqlite3.Connection, now: float) -> None:
+        """Keep only the last sample per series in each bucket of every tier.
+
+        Only whole buckets older than the tier's age are thinned, and samples
+        already at the tier's resolution are skipped, so each pass touches
+        just the samples that aged into a tier since the previous one.
+        """
+        for age, resolution in DOWNSAMPLE_TIERS:
+            cutoff = int(now - age) // resolution * resolution
+            rows = conn.execute(
+                "SELECT project, epic, ts FROM samples WHERE resolution < ? AND ts < ? "
+                "ORDER BY project, epic, ts",
+                (resolution, cutoff),
+            ).fetchall()
+            # (project, epic, bucket) -> ts of its last sample
+            last: dict[tuple[str, str, int], int] = {}
+            for project, epic, ts in rows:
+                last[(project, epic, ts // resolution)] = ts
+            conn.executemany(
+                "DELETE FROM samples WHERE project = ? AND epic = ? AND ts = ?",
+                [
+                    (project, epic, ts)
+                    for project, epic, ts in rows
+                    if last[(project, epic, ts // resolution)] != ts
+                ],
+            )
+            conn.executemany(
+                "UPDATE samples SET resolution = ? WHERE project = ? AND epic = ? AND ts = ?",
+                [(resolution, project, epic, ts) for (project, epic, _), ts in last.items()],
+            )
+
+    def query(
+        self, project: str = "", epic: str = "", start: int = 0, end: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the samples of one series between start and end (unix seconds).
+
+        The first point is the sample in effect at ``start``, so a chart can
+        begin with the counts as they were then.
+        """
+        end = int(time.time()) if end is None else end
+        try:
+            with closing(self.connect()) as conn:
+                before = conn.execute(
+                    "SELECT ts, resolution, counts FROM samples "
+                    "WHERE project = ? AND epic = ? AND ts < ? ORDER BY ts DESC LIMIT 1",
+                    (project, epic, start),
+                ).fetchall()
+                rows = conn.execute(
+                    "SELECT ts, resolution, counts FROM samples "
+                    "WHERE project = ? AND epic = ? AND ts BETWEEN ? AND ? ORDER BY ts",
+                    (project, epic, start, end),
+                ).fetchall()
+        except sqlite3.Error:
+            return []
+        return [
+            {"ts": ts, "resolution": resolution, **json.loads(counts)}
+            for ts, resolution, counts in before + rows
+        ]
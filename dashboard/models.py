@@ -1,10 +1,57 @@
 """Data models for the strategy dashboard."""
 
-from dataclasses import dataclass, asdict
+import json
+import sys
+from dataclasses import dataclass, field, fields
+from json.encoder import encode_basestring_ascii
 from typing import Any
 
 
-@dataclass
+def status_key(status: str | None) -> str:
+    """Normalize a status for matching ("In_Progress" -> "in progress")."""
+    return (status or "").strip().lower().replace("_", " ")
+
+
+def normalize_epic_status(status: str | None) -> str:
+    """Normalize an epic status: "not started", "in progress", "done", ..."""
+    return status_key(status) or "not started"
+
+
+def normalize_task_status(status: str | None) -> str:
+    """Normalize a task status to "done" or "todo".
+
+    Todo, Not Started and In Progress all count as todo for tasks.
+    """
+    return "done" if status_key(status) == "done" else "todo"
+
+
+def _json_str(value: str | None) -> str:
+    """Encode a string (or None) exactly as json.dumps would."""
+    return "null" if value is None else encode_basestring_ascii(value)
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a low-cardinality string so every row shares one copy."""
+    return None if value is None else sys.intern(value)
+
+
+def _state(row: Any) -> list[Any]:
+    """A row's field values, in order, as pickled."""
+    return [getattr(row, row_field.name) for row_field in fields(row)]
+
+
+def _restore(row: Any, state: list[Any]) -> None:
+    """Set a row's fields from its pickled state and re-run __post_init__.
+
+    Rows parsed by --processes workers come back pickled, and unpickling
+    alone skips __post_init__, so their strings would not be interned.
+    """
+    for row_field, value in zip(fields(row), state):
+        object.__setattr__(row, row_field.name, value)
+    row.__post_init__()
+
+
+@dataclass(slots=True)
 class Epic:
     """Represents an epic from a project's strategy folder."""
 
@@ -16,12 +63,49 @@ class Epic:
     priority: str | None  # from Dependencies section
     task_count: int  # total tasks listed
     completed_tasks: int  # tasks with [x]
+    # (task id, checked) per checklist entry; for the link graph, not sent to clients
+    task_links: tuple[tuple[str, bool], ...] = field(default=(), repr=False)
+    state: str = field(init=False, repr=False, compare=False)  # normalized status
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    def __post_init__(self):
+        self.status = _intern(self.status)
+        self.project = _intern(self.project)
+        self.priority = _intern(self.priority)
+        # Stored snapshots give back lists
+        self.task_links = tuple((task_id, checked) for task_id, checked in self.task_links)
+        self.state = _intern(normalize_epic_status(self.status))
+
+    def __getstate__(self) -> list[Any]:
+        return _state(self)
 
+    def __setstate__(self, state: list[Any]) -> None:
+        _restore(self, state)
 
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "project": self.project,
+            "file_path": self.file_path,
+            "priority": self.priority,
+            "task_count": self.task_count,
+            "completed_tasks": self.completed_tasks,
+            "state": self.state,
+        }
+
+    def to_json(self) -> str:
+        """Serialize directly to compact JSON, without building a dict."""
+        return (
+            f'{{"id":{_json_str(self.id)},"title":{_json_str(self.title)},'
+            f'"status":{_json_str(self.status)},"project":{_json_str(self.project)},'
+            f'"file_path":{_json_str(self.file_path)},"priority":{_json_str(self.priority)},'
+            f'"task_count":{self.task_count},"completed_tasks":{self.completed_tasks},'
+            f'"state":{_json_str(self.state)}}}'
+        )
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a task from a project's strategy folder."""
 
@@ -32,30 +116,69 @@ class Task:
     project: str  # parent project name
     epic_id: str  # parsed from epic link
     file_path: str  # absolute path for linking
+    epic_linked: bool = field(default=False, repr=False)  # epic_id from a link, not the filename
+    state: str = field(init=False, repr=False, compare=False)  # todo | done
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    def __post_init__(self):
+        self.status = _intern(self.status)
+        self.size = _intern(self.size)
+        self.project = _intern(self.project)
+        self.epic_id = _intern(self.epic_id)
+        self.state = _intern(normalize_task_status(self.status))
+
+    def __getstate__(self) -> list[Any]:
+        return _state(self)
 
+    def __setstate__(self, state: list[Any]) -> None:
+        _restore(self, state)
 
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "size": self.size,
+            "project": self.project,
+            "epic_id": self.epic_id,
+            "file_path": self.file_path,
+            "state": self.state,
+        }
+
+    def to_json(self) -> str:
+        """Serialize directly to compact JSON, without building a dict."""
+        return (
+            f'{{"id":{_json_str(self.id)},"title":{_json_str(self.title)},'
+            f'"status":{_json_str(self.status)},"size":{_json_str(self.size)},'
+            f'"project":{_json_str(self.project)},"epic_id":{_json_str(self.epic_id)},'
+            f'"file_path":{_json_str(self.file_path)},"state":{_json_str(self.state)}}}'
+        )
+
+
+@dataclass(slots=True)
 class Project:
     """Represents a project being tracked."""
 
     id: str  # directory name
     name: str  # display name
-    vision: "Vision | None" = None
-    okrs: list["Objective"] | None = None
+    vision: "Vision | None" = None  # only set by parser.load_project_details
+    okrs: list["Objective"] | None = None  # likewise
+    details_version: str | None = None  # changes when VISION.md or OKRs.md do
 
     def to_dict(self) -> dict[str, Any]:
         result = {"id": self.id, "name": self.name}
+        if self.details_version:
+            result["details_version"] = self.details_version
         if self.vision:
             result["vision"] = self.vision.to_dict()
         if self.okrs:
             result["okrs"] = [o.to_dict() for o in self.okrs]
         return result
 
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
 
-@dataclass
+@dataclass(slots=True)
 class Vision:
     """Represents a project's vision document."""
 
@@ -67,10 +190,17 @@ class Vision:
     success_metrics: list[str] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "north_star": self.north_star,
+            "vision": self.vision,
+            "mission": self.mission,
+            "strategic_bets": self.strategic_bets,
+            "non_goals": self.non_goals,
+            "success_metrics": self.success_metrics,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyResult:
     """Represents a key result under an objective."""
 
@@ -78,10 +208,10 @@ class KeyResult:
     text: str
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {"id": self.id, "text": self.text}
 
 
-@dataclass
+@dataclass(slots=True)
 class Objective:
     """Represents an OKR objective."""
 
@@ -1,47 +1,178 @@
 """Markdown parser for strategy files (epics and tasks)."""
 
+import hashlib
+import os
 import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, TextIO
 
 from models import Epic, Task, Project, Vision, Objective, KeyResult
 
+# File fingerprint used to detect changes: (st_mtime_ns, st_size)
+Fingerprint = tuple[int, int]
+
+# A strategy file of a project: (kind, path, fingerprint)
+ProjectFile = tuple[str, Path, Fingerprint]
+
+# Parallel scanning: files handed to each worker task at once, and the
+# number of files to re-parse worth the start-up cost of a process pool
+PARSE_CHUNKSIZE = 16
+PROCESS_POOL_MIN_FILES = 256
+
+# Epic and task files are read a chunk of whole lines at a time until the
+# header fields are found; if a required one is not found within
+# HEADER_MAX_CHARS, the rest of the file is read
+HEADER_CHUNK_CHARS = 4096
+HEADER_MAX_CHARS = 64 * 1024
+
+# Parsed files kept in ScanStats.slowest_files
+SLOWEST_FILES = 10
+
+# Project detail files, parsed only when a project's details are requested
+DETAIL_KINDS = ("vision", "okrs")
+
+# Parse cache: absolute file path -> (fingerprint, parsed result).
+# Lives for the whole process so a rescan only re-parses files that changed.
+_parse_cache: dict[str, tuple[Fingerprint, Any]] = {}
+
+# Same for VISION.md and OKRs.md, filled by load_project_details
+_detail_cache: dict[str, tuple[Fingerprint, Any]] = {}
+
 # Regex patterns for epic parsing
 EPIC_TITLE_PATTERN = re.compile(r"^# Epic:\s*(.+)$", re.MULTILINE)
 EPIC_STATUS_PATTERN = re.compile(r"^## Status\s*\n+`([^`]+)`", re.MULTILINE)
 EPIC_PRIORITY_PATTERN = re.compile(r"\*\*Priority:\*\*\s*`([^`]+)`")
 EPIC_TASK_PATTERN = re.compile(r"- \[([ x])\] \[([^\]]+)\]\(([^)]+)\)")
+# Priority is optional and sits in a section, so it is looked for in the
+# lines streamed for checkboxes rather than read ahead for
+EPIC_REQUIRED_PATTERNS = (EPIC_TITLE_PATTERN, EPIC_STATUS_PATTERN)
 
 # Regex patterns for task parsing
 TASK_TITLE_PATTERN = re.compile(r"^# Task:\s*(.+)$", re.MULTILINE)
 TASK_STATUS_PATTERN = re.compile(r"\*\*Status:\*\*\s*`([^`]+)`")
 TASK_SIZE_PATTERN = re.compile(r"\*\*Size:\*\*\s*`([^`]+)`")
 TASK_EPIC_PATTERN = re.compile(r"\*\*Epic:\*\*\s*\[([^\]]+)\]\(([^)]+)\)")
+TASK_REQUIRED_PATTERNS = (TASK_TITLE_PATTERN, TASK_STATUS_PATTERN)
+# Optional fields are only looked for in the header block, which ends at the
+# first "## " section
+TASK_OPTIONAL_PATTERNS = (TASK_SIZE_PATTERN, TASK_EPIC_PATTERN)
+TASK_HEADER_END_PATTERN = re.compile(r"^## ", re.MULTILINE)
+
+# Regex patterns for vision and OKR parsing
+SECTION_HEADER_PATTERN = re.compile(r"^##(.*)$", re.MULTILINE)
+NUMBERED_ITEM_PATTERN = re.compile(r"^\d+[.)]\s*(.+)$")
+OBJECTIVE_HEADER_PATTERN = re.compile(r"Objective\s*(\d+)\s*[—–-]\s*(.+)$")
+INTENT_PATTERN = re.compile(r"\*\*Intent:\*\*\s*(.+?)(?:\n|$)")
+KEY_RESULT_PATTERN = re.compile(r"^-\s*\*\*KR(\d+):\*\*\s*(.*)$")
+
+
+def search_header(
+    text: str,
+    required: tuple[re.Pattern, ...],
+    optional: tuple[re.Pattern, ...] = (),
+    header_end: re.Pattern | None = None,
+) -> tuple[list, list, bool]:
+    """Search text for header fields.
+
+    Returns (required matches, optional matches, whether the header block
+    ended in text). Optional fields are only searched for before the first
+    ``header_end`` match.
+    """
+    end = header_end.search(text) if header_end else None
+    header_length = end.start() if end else len(text)
+    return (
+        [pattern.search(text) for pattern in required],
+        [pattern.search(text, 0, header_length) for pattern in optional],
+        end is not None,
+    )
+
+
+def read_header(
+    f: TextIO,
+    required: tuple[re.Pattern, ...],
+    optional: tuple[re.Pattern, ...] = (),
+    header_end: re.Pattern | None = None,
+) -> tuple[list, list, str, bool]:
+    """Read whole lines from f until the header fields are found.
+
+    Stops once every required field has matched and every optional one has
+    either matched or been left out of a header block that ended (see
+    search_header). Searches once per HEADER_CHUNK_CHARS read, and only at a
+    line end, so a match is never cut short by a partial line. Gives up after
+    HEADER_MAX_CHARS. Returns (required matches, optional matches, text read,
+    whether f was read to the end); the matches are the first in the file,
+    as in a full search.
+    """
+    parts: list[str] = []
+    length = 0
+    unsearched = 0
+    while True:
+        line = f.readline(HEADER_CHUNK_CHARS)
+        parts.append(line)
+        length += len(line)
+        unsearched += len(line)
+        at_end = not line
+        if at_end or (unsearched >= HEADER_CHUNK_CHARS and line.endswith("\n")):
+            text = "".join(parts)
+            parts = [text]
+            unsearched = 0
+            found, extra, ended = search_header(text, required, optional, header_end)
+            complete = all(found) and (ended or all(extra))
+            if at_end or complete or length >= HEADER_MAX_CHARS:
+                return found, extra, text, at_end
+
+
+def link_target_id(link: str) -> str:
+    """Return the file id a markdown link points at ("../tasks/a.md#x" -> "a")."""
+    return Path(link.partition("#")[0]).stem
+
+
+def read_checkboxes(text: str) -> list[tuple[str, bool]]:
+    """Return (linked task id, checked) for each task checkbox in text."""
+    return [
+        (link_target_id(link), checkbox == "x")
+        for checkbox, _, link in EPIC_TASK_PATTERN.findall(text)
+    ]
 
 
 def parse_epic(file_path: Path, project_name: str) -> Epic | None:
-    """Parse an epic markdown file and return an Epic object."""
+    """Parse an epic markdown file and return an Epic object.
+
+    The title and status are read with read_header; the task checkboxes
+    and the optional priority are then picked up line by line, so the file
+    is never held in memory as a whole unless the title or status is
+    missing from its first HEADER_MAX_CHARS.
+    """
     try:
-        content = file_path.read_text(encoding="utf-8")
+        with open(file_path, encoding="utf-8") as f:
+            matches, _, text, at_end = read_header(f, EPIC_REQUIRED_PATTERNS)
+            if not at_end and not all(matches):
+                # A field may still follow: search the whole file
+                text += f.read()
+                matches = [pattern.search(text) for pattern in EPIC_REQUIRED_PATTERNS]
+            priority_match = EPIC_PRIORITY_PATTERN.search(text)
+            task_links = read_checkboxes(text)
+            for line in f:
+                if "- [" in line:
+                    task_links.extend(read_checkboxes(line))
+                if priority_match is None and "**Priority:**" in line:
+                    priority_match = EPIC_PRIORITY_PATTERN.search(line)
     except (OSError, UnicodeDecodeError):
         return None
+    title_match, status_match = matches
 
     # Extract title
-    title_match = EPIC_TITLE_PATTERN.search(content)
     title = title_match.group(1).strip() if title_match else file_path.stem
 
     # Extract status
-    status_match = EPIC_STATUS_PATTERN.search(content)
     status = status_match.group(1).strip() if status_match else "Not Started"
 
     # Extract priority
-    priority_match = EPIC_PRIORITY_PATTERN.search(content)
     priority = priority_match.group(1).strip() if priority_match else None
 
-    # Count tasks from the ## Tasks section
-    task_matches = EPIC_TASK_PATTERN.findall(content)
-    task_count = len(task_matches)
-    completed_tasks = sum(1 for checkbox, _, _ in task_matches if checkbox == "x")
-
     return Epic(
         id=file_path.stem,
         title=title,
@@ -49,36 +180,48 @@ def parse_epic(file_path: Path, project_name: str) -> Epic | None:
         project=project_name,
         file_path=str(file_path),
         priority=priority,
-        task_count=task_count,
-        completed_tasks=completed_tasks,
+        task_count=len(task_links),
+        completed_tasks=sum(1 for _, checked in task_links if checked),
+        task_links=tuple(task_links),
     )
 
 
 def parse_task(file_path: Path, project_name: str) -> Task | None:
-    """Parse a task markdown file and return a Task object."""
+    """Parse a task markdown file and return a Task object.
+
+    Reading stops once the title and status are found and the header block
+    has ended, so logs and notes below it are never read. A size or epic
+    link missing from the header block is left to its default; only if the
+    title or status is missing is the whole file searched.
+    """
     try:
-        content = file_path.read_text(encoding="utf-8")
+        with open(file_path, encoding="utf-8") as f:
+            required, optional, text, at_end = read_header(
+                f, TASK_REQUIRED_PATTERNS, TASK_OPTIONAL_PATTERNS, TASK_HEADER_END_PATTERN
+            )
+            if not at_end and not all(required):
+                text += f.read()
+                required, optional, _ = search_header(
+                    text, TASK_REQUIRED_PATTERNS, TASK_OPTIONAL_PATTERNS, TASK_HEADER_END_PATTERN
+                )
     except (OSError, UnicodeDecodeError):
         return None
+    title_match, status_match = required
+    size_match, epic_match = optional
 
     # Extract title
-    title_match = TASK_TITLE_PATTERN.search(content)
     title = title_match.group(1).strip() if title_match else file_path.stem
 
     # Extract status
-    status_match = TASK_STATUS_PATTERN.search(content)
     status = status_match.group(1).strip() if status_match else "Todo"
 
     # Extract size
-    size_match = TASK_SIZE_PATTERN.search(content)
     size = size_match.group(1).strip() if size_match else "M"
 
     # Extract epic link
-    epic_match = TASK_EPIC_PATTERN.search(content)
     if epic_match:
-        epic_link = epic_match.group(2)
         # Extract epic id from link like "../epics/epic-name.md"
-        epic_id = Path(epic_link).stem
+        epic_id = link_target_id(epic_match.group(2))
     else:
         # Try to infer from filename (e.g., epic-name-001-task.md)
         parts = file_path.stem.split("-")
@@ -98,6 +241,7 @@ def parse_task(file_path: Path, project_name: str) -> Task | None:
         project=project_name,
         epic_id=epic_id,
         file_path=str(file_path),
+        epic_linked=epic_match is not None,
     )
 
 
@@ -107,13 +251,49 @@ def format_project_name(dir_name: str) -> str:
     return dir_name.replace("-", " ").title()
 
 
+def iter_sections(content: str) -> list[tuple[str, str]]:
+    """Tokenize a markdown document into (header, body) pairs in a single pass.
+
+    A section starts at any line beginning with "##" (so "###" sub-headers
+    end the enclosing section) and runs until the next such line. Headers
+    are given without the leading "##"; bodies are stripped. Text before the
+    first header is ignored.
+    """
+    sections: list[tuple[str, str]] = []
+    header = None
+    body_start = 0
+    for match in SECTION_HEADER_PATTERN.finditer(content):
+        if header is not None:
+            sections.append((header, content[body_start : match.start()].strip()))
+        header = match.group(1).strip()
+        body_start = match.end() + 1
+    if header is not None:
+        sections.append((header, content[body_start:].strip()))
+    return sections
+
+
+def split_sections(content: str) -> dict[str, str]:
+    """Split a markdown document into a header -> body map.
+
+    The first section with a given header wins.
+    """
+    sections: dict[str, str] = {}
+    for header, body in iter_sections(content):
+        sections.setdefault(header, body)
+    return sections
+
+
+def find_section(sections: dict[str, str], header: str) -> str | None:
+    """Return the body of the first section whose header starts with header."""
+    for name, body in sections.items():
+        if name.startswith(header):
+            return body
+    return None
+
+
 def extract_section(content: str, header: str) -> str | None:
     """Extract content under a markdown header until the next header or end."""
-    pattern = rf"^##\s*{re.escape(header)}.*?\n(.*?)(?=^##|\Z)"
-    match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return None
+    return find_section(split_sections(content), header)
 
 
 def extract_bullet_list(text: str | None) -> list[str]:
@@ -142,7 +322,7 @@ def extract_numbered_list(text: str | None) -> list[str]:
     for line in text.split("\n"):
         line = line.strip()
         # Match "1. text" or "1) text" patterns
-        match = re.match(r"^\d+[.)]\s*(.+)$", line)
+        match = NUMBERED_ITEM_PATTERN.match(line)
         if match:
             items.append(match.group(1).strip())
     return items
@@ -155,12 +335,14 @@ def parse_vision(file_path: Path) -> Vision | None:
     except (OSError, UnicodeDecodeError):
         return None
 
+    sections = split_sections(content)
+
     # Extract North Star (single paragraph after header)
-    north_star_section = extract_section(content, "North Star")
+    north_star_section = find_section(sections, "North Star")
     north_star = north_star_section.split("\n")[0] if north_star_section else None
 
-    # Extract Vision (paragraph content)
-    vision_section = extract_section(content, r"Vision.*")
+    # Extract Vision (paragraph content, e.g. under "## Vision (3-5 Years)")
+    vision_section = find_section(sections, "Vision")
     vision_text = None
     if vision_section:
         # Get first paragraph before any sub-headers or lists
@@ -173,21 +355,21 @@ def parse_vision(file_path: Path) -> Vision | None:
         vision_text = " ".join(lines) if lines else None
 
     # Extract Mission bullets
-    mission_section = extract_section(content, "Mission")
+    mission_section = find_section(sections, "Mission")
     mission = extract_bullet_list(mission_section)
 
     # Extract Strategic Bets (numbered list)
-    bets_section = extract_section(content, "Strategic Bets")
+    bets_section = find_section(sections, "Strategic Bets")
     strategic_bets = extract_numbered_list(bets_section) or extract_bullet_list(
         bets_section
     )
 
     # Extract Non-Goals
-    non_goals_section = extract_section(content, "Non-Goals")
+    non_goals_section = find_section(sections, "Non-Goals")
     non_goals = extract_bullet_list(non_goals_section)
 
     # Extract Success Metrics
-    metrics_section = extract_section(content, "Success Metrics")
+    metrics_section = find_section(sections, "Success Metrics")
     success_metrics = extract_bullet_list(metrics_section)
 
     return Vision(
@@ -200,6 +382,40 @@ def parse_vision(file_path: Path) -> Vision | None:
     )
 
 
+def parse_key_results(text: str) -> list[KeyResult]:
+    """Extract "- **KRn:** text" items from a section body.
+
+    A key result may continue over the following lines; it ends at the next
+    key result or a "---" rule.
+    """
+    key_results: list[KeyResult] = []
+    kr_id = None
+    kr_lines: list[str] = []
+
+    def flush() -> None:
+        # Clean up multi-line KRs
+        kr_text = " ".join(line for line in kr_lines if line)
+        if kr_id and kr_text:
+            key_results.append(KeyResult(id=kr_id, text=kr_text))
+
+    for line in text.split("\n"):
+        stripped = line.strip()
+        kr_match = KEY_RESULT_PATTERN.match(stripped)
+        if kr_match:
+            flush()
+            kr_id = f"KR{kr_match.group(1)}"
+            kr_lines = [kr_match.group(2).strip()]
+        elif line.startswith("---"):
+            flush()
+            kr_id = None
+            kr_lines = []
+        elif kr_id:
+            kr_lines.append(stripped)
+    flush()
+
+    return key_results
+
+
 def parse_okrs(file_path: Path) -> list[Objective]:
     """Parse an OKRs.md file and return a list of Objective objects."""
     try:
@@ -208,110 +424,376 @@ def parse_okrs(file_path: Path) -> list[Objective]:
         return []
 
     objectives = []
+    objective_header = None
+    objective_bodies: list[str] = []
 
-    # Find all Objective headers (## Objective N — Title)
-    obj_pattern = re.compile(
-        r"^##\s*Objective\s*(\d+)\s*[—–-]\s*(.+?)$", re.MULTILINE
-    )
-
-    matches = list(obj_pattern.finditer(content))
-
-    for i, match in enumerate(matches):
-        obj_num = match.group(1)
-        obj_title = match.group(2).strip()
-        obj_id = f"O{obj_num}"
-
-        # Get content until next Objective or end
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-        obj_content = content[start:end]
+    def add_objective() -> None:
+        obj_content = "\n".join(objective_bodies)
 
         # Extract intent (line starting with **Intent:**)
-        intent_match = re.search(r"\*\*Intent:\*\*\s*(.+?)(?:\n|$)", obj_content)
+        intent_match = INTENT_PATTERN.search(obj_content)
         intent = intent_match.group(1).strip() if intent_match else None
 
-        # Extract Key Results (### Key Results section or - **KR1:** patterns)
-        key_results = []
-        kr_pattern = re.compile(
-            r"-\s*\*\*KR(\d+):\*\*\s*(.+?)(?=\n-\s*\*\*KR|\n##|\n---|\Z)",
-            re.DOTALL,
-        )
-        for kr_match in kr_pattern.finditer(obj_content):
-            kr_id = f"KR{kr_match.group(1)}"
-            kr_text = kr_match.group(2).strip()
-            # Clean up multi-line KRs
-            kr_text = " ".join(line.strip() for line in kr_text.split("\n") if line.strip())
-            key_results.append(KeyResult(id=kr_id, text=kr_text))
+        # Key results may sit directly under the objective or in sub-sections
+        key_results = [
+            kr for body in objective_bodies for kr in parse_key_results(body)
+        ]
 
         objectives.append(
             Objective(
-                id=obj_id,
-                title=obj_title,
+                id=f"O{objective_header.group(1)}",
+                title=objective_header.group(2).strip(),
                 intent=intent,
                 key_results=key_results if key_results else None,
             )
         )
 
+    # Each Objective (## Objective N — Title) owns every section up to the next one
+    for header, body in iter_sections(content):
+        header_match = OBJECTIVE_HEADER_PATTERN.match(header)
+        if header_match:
+            if objective_header:
+                add_objective()
+            objective_header = header_match
+            objective_bodies = [body]
+        elif objective_header:
+            objective_bodies.append(body)
+    if objective_header:
+        add_objective()
+
     return objectives
 
 
-def scan_project(project_path: Path) -> tuple[Project, list[Epic], list[Task]]:
-    """Scan a single project's strategy folder and return all epics and tasks."""
-    project_name = project_path.name
-    strategy_path = project_path / "strategy"
+def file_fingerprint(file_path: Path) -> Fingerprint | None:
+    """Return the (mtime_ns, size) fingerprint of a file, or None if missing."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def export_parse_cache() -> dict[str, tuple[Fingerprint, Any]]:
+    """Return a copy of the parse cache, e.g. to persist it."""
+    return dict(_parse_cache)
+
+
+def import_parse_cache(entries: dict[str, tuple[Fingerprint, Any]]) -> None:
+    """Seed the parse cache with previously saved entries."""
+    _parse_cache.update(entries)
+
+
+def evict_stale(seen: set[str]) -> list[str]:
+    """Drop cache entries for files that were not seen in the latest scan.
+
+    Returns the paths dropped from the parse cache.
+    """
+    evicted = [key for key in _parse_cache if key not in seen]
+    for key in evicted:
+        del _parse_cache[key]
+    # Request threads fill _detail_cache while this runs: list() copies its
+    # keys in one step, and a key may be gone by the time it is popped
+    for key in list(_detail_cache):
+        if key not in seen:
+            _detail_cache.pop(key, None)
+    return evicted
 
-    project = Project(id=project_name, name=format_project_name(project_name))
-    epics: list[Epic] = []
-    tasks: list[Task] = []
 
-    if not strategy_path.exists():
-        return project, epics, tasks
+def list_markdown_files(dir_path: Path) -> list[tuple[Path, Fingerprint]]:
+    """List *.md files in a directory with their fingerprints, sorted by name."""
+    files = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.name, (stat.st_mtime_ns, stat.st_size)))
+    except OSError:
+        return []
+    files.sort()
+    return [(dir_path / name, fingerprint) for name, fingerprint in files]
+
+
+def list_detail_files(project_path: Path) -> list[ProjectFile]:
+    """List a project's VISION.md and OKRs.md with their fingerprints."""
+    strategy_path = project_path / "strategy"
+    files: list[ProjectFile] = []
 
-    # Parse VISION.md
+    # VISION.md
     vision_path = strategy_path / "VISION.md"
-    if vision_path.exists():
-        project.vision = parse_vision(vision_path)
+    fingerprint = file_fingerprint(vision_path)
+    if fingerprint:
+        files.append(("vision", vision_path, fingerprint))
 
-    # Parse OKRs.md (try both cases)
+    # OKRs.md (try both cases)
     okrs_path = strategy_path / "OKRs.md"
-    if not okrs_path.exists():
+    fingerprint = file_fingerprint(okrs_path)
+    if not fingerprint:
         okrs_path = strategy_path / "OKRS.md"
-    if okrs_path.exists():
-        project.okrs = parse_okrs(okrs_path)
-
-    # Scan epics
-    epics_path = strategy_path / "epics"
-    if epics_path.exists():
-        for epic_file in sorted(epics_path.glob("*.md")):
-            epic = parse_epic(epic_file, project_name)
-            if epic:
-                epics.append(epic)
-
-    # Scan tasks
-    tasks_path = strategy_path / "tasks"
-    if tasks_path.exists():
-        for task_file in sorted(tasks_path.glob("*.md")):
-            task = parse_task(task_file, project_name)
-            if task:
-                tasks.append(task)
+        fingerprint = file_fingerprint(okrs_path)
+    if fingerprint:
+        files.append(("okrs", okrs_path, fingerprint))
+    return files
+
+
+def list_project_files(project_path: Path) -> list[ProjectFile]:
+    """List a project's strategy files with their fingerprints, in scan order."""
+    strategy_path = project_path / "strategy"
+    files = list_detail_files(project_path)
+    for epic_file, fingerprint in list_markdown_files(strategy_path / "epics"):
+        files.append(("epic", epic_file, fingerprint))
+    for task_file, fingerprint in list_markdown_files(strategy_path / "tasks"):
+        files.append(("task", task_file, fingerprint))
+
+    return files
+
+
+def parse_file(kind: str, file_path: Path, project_name: str) -> Any:
+    """Parse one strategy file of the given kind (vision, okrs, epic or task)."""
+    if kind == "epic":
+        return parse_epic(file_path, project_name)
+    if kind == "task":
+        return parse_task(file_path, project_name)
+    if kind == "vision":
+        return parse_vision(file_path)
+    return parse_okrs(file_path)
+
+
+def parse_file_timed(kind: str, file_path: Path, project_name: str) -> tuple[Any, float]:
+    """Parse one strategy file and return (result, seconds spent)."""
+    start = time.perf_counter()
+    result = parse_file(kind, file_path, project_name)
+    return result, time.perf_counter() - start
+
+
+@dataclass
+class ScanStats:
+    """Timings and counts of one scan_all_projects call."""
+
+    duration: float = 0.0  # whole scan, wall clock
+    list_duration: float = 0.0  # listing and stat-ing files, wall clock
+    parse_duration: float = 0.0  # parsing changed files, wall clock
+    files_parsed: int = 0
+    files_skipped: int = 0  # unchanged files served from the parse cache
+    # project -> listing time plus the parse time of its changed files
+    project_durations: dict[str, float] = field(default_factory=dict)
+    # (seconds, path) of the slowest files parsed, slowest first
+    slowest_files: list[tuple[float, str]] = field(default_factory=list)
+    # Parse cache entries of the files parsed, and paths evicted from it,
+    # so indexes over the cache can be updated with just this scan's changes
+    parsed: dict[str, tuple[Fingerprint, Any]] = field(default_factory=dict)
+    evicted: list[str] = field(default_factory=list)
+
+
+def cache_misses(
+    jobs: list[tuple[str, Path, Fingerprint, str]],
+) -> list[tuple[str, Path, Fingerprint, str]]:
+    """Return the epic/task jobs whose file is not in the parse cache with its fingerprint."""
+    return [
+        job for job in jobs
+        if job[0] not in DETAIL_KINDS
+        and _parse_cache.get(str(job[1]), (None,))[0] != job[2]
+    ]
+
+
+def parse_changed_files(
+    jobs: list[tuple[str, Path, Fingerprint, str]],
+    executor: Executor | None = None,
+    stats: ScanStats | None = None,
+) -> None:
+    """Parse every job whose file is not in the parse cache with its fingerprint.
+
+    Vision and OKR jobs are skipped; load_project_details parses those.
+    """
+    jobs = [job for job in jobs if job[0] not in DETAIL_KINDS]
+    misses = cache_misses(jobs)
+    kinds, paths, fingerprints, names = zip(*misses) if misses else ((), (), (), ())
+    if executor is not None and len(misses) > 1:
+        results = executor.map(
+            parse_file_timed, kinds, paths, names, chunksize=PARSE_CHUNKSIZE
+        )
+    else:
+        results = map(parse_file_timed, kinds, paths, names)
+    timings = []
+    for file_path, fingerprint, name, (result, seconds) in zip(
+        paths, fingerprints, names, results
+    ):
+        _parse_cache[str(file_path)] = (fingerprint, result)
+        timings.append((seconds, str(file_path), name))
+        if stats is not None:
+            stats.parsed[str(file_path)] = (fingerprint, result)
+
+    if stats is not None:
+        stats.files_parsed += len(misses)
+        stats.files_skipped += len(jobs) - len(misses)
+        for seconds, _, name in timings:
+            stats.project_durations[name] = stats.project_durations.get(name, 0.0) + seconds
+        timings.sort(reverse=True)
+        stats.slowest_files = [(seconds, path) for seconds, path, _ in timings[:SLOWEST_FILES]]
+
+
+def build_project(
+    project_name: str, files: list[ProjectFile]
+) -> tuple[Project, list[Epic], list[Task]]:
+    """Assemble a project and its epics and tasks from parse cache entries.
+
+    The project carries only its id, name and details_version; its vision
+    and OKRs are left for load_project_details.
+    """
+    project = Project(
+        id=project_name,
+        name=format_project_name(project_name),
+        details_version=details_version(files),
+    )
+    epics: list[Epic] = []
+    tasks: list[Task] = []
+
+    for kind, file_path, _ in files:
+        if kind in DETAIL_KINDS:
+            continue
+        result = _parse_cache[str(file_path)][1]
+        if kind == "epic" and result:
+            epics.append(result)
+        elif kind == "task" and result:
+            tasks.append(result)
 
     return project, epics, tasks
 
 
+def details_version(files: list[ProjectFile]) -> str | None:
+    """Return a token that changes whenever a project's detail files change.
+
+    None if the project has neither VISION.md nor OKRs.md.
+    """
+    details = [
+        f"{path.name}:{fingerprint[0]}:{fingerprint[1]}"
+        for kind, path, fingerprint in files
+        if kind in DETAIL_KINDS
+    ]
+    if not details:
+        return None
+    return hashlib.sha1("\n".join(details).encode("utf-8")).hexdigest()[:16]
+
+
+def load_project_details(project_path: Path, project_name: str) -> Project:
+    """Return a project with its vision and OKRs, parsing files that changed.
+
+    Parsed files are cached by fingerprint, so repeated calls re-parse only
+    a VISION.md or OKRs.md that changed since.
+    """
+    files = list_detail_files(project_path)
+    project = Project(
+        id=project_name,
+        name=format_project_name(project_name),
+        details_version=details_version(files),
+    )
+    for kind, file_path, fingerprint in files:
+        key = str(file_path)
+        cached = _detail_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            result = cached[1]
+        else:
+            result = parse_file(kind, file_path, project_name)
+            _detail_cache[key] = (fingerprint, result)
+        if kind == "vision":
+            project.vision = result
+        else:
+            project.okrs = result
+    return project
+
+
+def scan_project(
+    project_path: Path, seen: set[str] | None = None
+) -> tuple[Project, list[Epic], list[Task]]:
+    """Scan a single project's strategy folder and return all epics and tasks.
+
+    Files whose fingerprint is unchanged since the last scan are served from
+    the parse cache; every file visited is recorded in ``seen`` if given.
+    """
+    files = list_project_files(project_path)
+    parse_changed_files([(kind, path, fp, project_path.name) for kind, path, fp in files])
+    if seen is not None:
+        seen.update(str(path) for _, path, _ in files)
+    return build_project(project_path.name, files)
+
+
 def scan_all_projects(
-    projects_dir: Path, project_names: list[str]
+    projects_dir: Path,
+    project_names: list[str],
+    workers: int = 1,
+    use_processes: bool = False,
+    stats: ScanStats | None = None,
 ) -> tuple[list[Project], list[Epic], list[Task]]:
-    """Scan all configured projects and return aggregated data."""
+    """Scan all configured projects and return aggregated data.
+
+    Only files that changed since the previous call are re-parsed; cache
+    entries for files that disappeared are evicted. With ``workers`` > 1,
+    projects are listed and changed files parsed through a thread pool (or a
+    process pool for parsing if ``use_processes``), so file-open latency
+    overlaps. Results keep the order of ``project_names`` and file names.
+    Timings and counts are recorded in ``stats`` if given.
+
+    Project names are paths relative to ``projects_dir`` (e.g. "repo" or
+    "org/repo") and become the project ids.
+    """
+    scan_start = time.perf_counter()
+    list_durations: dict[str, float] = {}
+
+    def list_existing(name: str) -> list[ProjectFile] | None:
+        start = time.perf_counter()
+        project_path = projects_dir / name
+        files = list_project_files(project_path) if project_path.exists() else None
+        list_durations[name] = time.perf_counter() - start
+        return files
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            listings = list(pool.map(list_existing, project_names))
+    else:
+        listings = [list_existing(name) for name in project_names]
+
+    scanned = [
+        (name, files)
+        for name, files in zip(project_names, listings)
+        if files is not None
+    ]
+    jobs = [
+        (kind, file_path, fingerprint, name)
+        for name, files in scanned
+        for kind, file_path, fingerprint in files
+    ]
+    parse_start = time.perf_counter()
+    if stats is not None:
+        stats.list_duration = parse_start - scan_start
+        stats.project_durations = {name: list_durations[name] for name, _ in scanned}
+    # Only cache misses are sent to the pool, so an unchanged tree of any
+    # size is rescanned without starting processes
+    if workers > 1 and use_processes and len(cache_misses(jobs)) >= PROCESS_POOL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parse_changed_files(jobs, pool, stats)
+    elif workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parse_changed_files(jobs, pool, stats)
+    else:
+        parse_changed_files(jobs, stats=stats)
+    if stats is not None:
+        stats.parse_duration = time.perf_counter() - parse_start
+
     all_projects: list[Project] = []
     all_epics: list[Epic] = []
     all_tasks: list[Task] = []
-
-    for name in project_names:
-        project_path = projects_dir / name
-        if project_path.exists():
-            project, epics, tasks = scan_project(project_path)
-            all_projects.append(project)
-            all_epics.extend(epics)
-            all_tasks.extend(tasks)
-
+    for name, files in scanned:
+        project, epics, tasks = build_project(name, files)
+        all_projects.append(project)
+        all_epics.extend(epics)
+        all_tasks.extend(tasks)
+
+    evicted = evict_stale({str(file_path) for _, file_path, _, _ in jobs})
+    if stats is not None:
+        stats.evicted = evicted
+        stats.duration = time.perf_counter() - scan_start
     return all_projects, all_epics, all_tasks
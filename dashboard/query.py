@@ -0,0 +1,145 @@
+"""In-memory indexes for filtering and paginating snapshot rows."""
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any
+
+from models import Epic, Task, normalize_epic_status, normalize_task_status
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+# Query parameters each kind of row can be filtered by
+FILTERS = {
+    "epics": ("project", "status", "q"),
+    "tasks": ("project", "status", "epic", "size", "q"),
+}
+
+
+class StaleCursor(Exception):
+    """A pagination cursor issued for another snapshot version."""
+
+
+def intersect(positions: list[int], others: list[list[int]]) -> list[int]:
+    """Return the positions present in every list of ``others``.
+
+    All lists are ascending. Each lookup bisects forward from the previous
+    match, so the cost is about len(positions) * log(len(other)) per list
+    rather than building a set of every list on every query.
+    """
+    for other in others:
+        found = []
+        low = 0
+        for position in positions:
+            low = bisect_left(other, position, low)
+            if low == len(other):
+                break
+            if other[low] == position:
+                found.append(position)
+        positions = found
+    return positions
+
+
+class RowIndex:
+    """Epic or task rows of one snapshot, indexed by the fields clients filter on.
+
+    Each index maps a value to the ascending positions of the matching rows,
+    so a query only visits rows in its most selective index. Cursors carry
+    the snapshot ``version`` as well as a row position, since positions
+    shift when the tree is rescanned.
+    """
+
+    def __init__(self, rows: list[Epic] | list[Task], version: int = 0):
+        self.rows = rows
+        self.version = version
+        self.by_project: dict[str, list[int]] = defaultdict(list)
+        # Keyed on the normalized state, which is what clients display
+        self.by_state: dict[str, list[int]] = defaultdict(list)
+        self.by_size: dict[str, list[int]] = defaultdict(list)
+        self.by_epic: dict[str, list[int]] = defaultdict(list)
+        self.by_project_epic: dict[tuple[str, str], list[int]] = defaultdict(list)
+        # Lowercased "title id" per row for the q filter
+        self.search_text: list[str] = []
+        # Maps a status filter to the state it selects ("In Progress" is
+        # "todo" for tasks but its own state for epics)
+        is_tasks = bool(rows) and isinstance(rows[0], Task)
+        self.normalize_status = normalize_task_status if is_tasks else normalize_epic_status
+
+        for position, row in enumerate(rows):
+            self.by_project[row.project].append(position)
+            self.by_state[row.state].append(position)
+            if isinstance(row, Task):
+                self.by_size[row.size.upper()].append(position)
+                self.by_epic[row.epic_id].append(position)
+                self.by_project_epic[(row.project, row.epic_id)].append(position)
+            self.search_text.append(f"{row.title}\n{row.id}".lower())
+
+    def parse_cursor(self, cursor: str | None) -> int:
+        """Return the row position a ``next_cursor`` value resumes from (0 if empty).
+
+        Raises StaleCursor if it was issued for another snapshot version and
+        ValueError if it is not a cursor.
+        """
+        if not cursor:
+            return 0
+        version, _, position = cursor.partition(":")
+        if not (version.isdigit() and position.isdigit()):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        if int(version) != self.version:
+            raise StaleCursor(cursor)
+        return int(position)
+
+    def query(
+        self,
+        project: str | None = None,
+        status: str | None = None,
+        epic: str | None = None,
+        size: str | None = None,
+        q: str | None = None,
+        limit: int = DEFAULT_LIMIT,
+        cursor: int = 0,
+    ) -> dict[str, Any]:
+        """Return one page of rows matching every given filter.
+
+        ``status`` matches rows by normalized state, as shown by clients.
+
+        ``cursor`` is the row position to resume from, as parsed from the
+        ``next_cursor`` of the previous page. ``counts`` gives the number of
+        matches per normalized state across all pages.
+        """
+        candidates = []
+        if project and epic:
+            candidates.append(self.by_project_epic.get((project, epic), []))
+        elif project:
+            candidates.append(self.by_project.get(project, []))
+        elif epic:
+            candidates.append(self.by_epic.get(epic, []))
+        if status:
+            candidates.append(self.by_state.get(self.normalize_status(status), []))
+        if size:
+            candidates.append(self.by_size.get(size.upper(), []))
+
+        if candidates:
+            candidates.sort(key=len)
+            matches = intersect(candidates[0], candidates[1:])
+        else:
+            matches = list(range(len(self.rows)))
+
+        if q:
+            needle = q.lower()
+            matches = [
+                position for position in matches if needle in self.search_text[position]
+            ]
+
+        counts: dict[str, int] = defaultdict(int)
+        for position in matches:
+            counts[self.rows[position].state] += 1
+
+        start = bisect_left(matches, cursor)
+        page = matches[start : start + limit]
+        more = start + limit < len(matches)
+        return {
+            "total": len(matches),
+            "counts": counts,
+            "items": [self.rows[position] for position in page],
+            "next_cursor": f"{self.version}:{matches[start + limit]}" if more else None,
+        }
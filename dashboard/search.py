@@ -0,0 +1,163 @@
+"""Full-text search over epic and task files."""
+
+import math
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from models import Epic, Task
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+TITLE_WEIGHT = 3  # a title term counts as this many body occurrences
+SNIPPET_WIDTH = 160
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def make_snippet(content: str, terms: list[str]) -> str:
+    """Return a short excerpt of content around the first query term."""
+    lower = content.lower()
+    positions = [lower.find(term) for term in terms]
+    positions = [position for position in positions if position >= 0]
+    if not positions:
+        return ""
+    start = max(0, min(positions) - SNIPPET_WIDTH // 4)
+    snippet = " ".join(content[start : start + SNIPPET_WIDTH].split())
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + SNIPPET_WIDTH < len(content) else ""
+    return f"{prefix}{snippet}{suffix}"
+
+
+class SearchIndex:
+    """Inverted index over the titles and full bodies of epic and task files.
+
+    ``sync`` builds the index from the whole parse cache once; after that,
+    ``update`` applies the files each scan parsed or evicted, so bodies are
+    only read for files that changed. Callers hold ``lock`` around updates
+    and searches.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # path -> (fingerprint, row info, document length)
+        self.docs: dict[str, tuple[tuple[int, int], dict[str, str], int]] = {}
+        # term -> {path: weighted term frequency}
+        self.postings: dict[str, dict[str, int]] = defaultdict(dict)
+        # path -> indexed terms, to remove a document's postings
+        self.doc_terms: dict[str, list[str]] = {}
+        self.total_length = 0
+
+    def sync(self, entries: dict[str, tuple[tuple[int, int], Any]]) -> None:
+        """Index changed epic/task files from parse cache entries; drop removed ones."""
+        for path, (fingerprint, result) in entries.items():
+            if not isinstance(result, (Epic, Task)):
+                continue
+            doc = self.docs.get(path)
+            if doc is None or doc[0] != fingerprint:
+                self.add(path, fingerprint, result)
+        for path in [path for path in self.docs if path not in entries]:
+            self.remove(path)
+
+    def update(
+        self, parsed: dict[str, tuple[tuple[int, int], Any]], evicted: list[str]
+    ) -> None:
+        """Re-index the files one scan parsed and drop the ones it evicted."""
+        for path, (fingerprint, result) in parsed.items():
+            if isinstance(result, (Epic, Task)):
+                self.add(path, fingerprint, result)
+            else:
+                self.remove(path)
+        for path in evicted:
+            self.remove(path)
+
+    def add(self, path: str, fingerprint: tuple[int, int], item: Epic | Task) -> None:
+        """(Re-)index one file."""
+        self.remove(path)
+        try:
+            body = Path(path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            body = ""
+
+        frequencies: dict[str, int] = defaultdict(int)
+        for term in tokenize(body):
+            frequencies[term] += 1
+        for term in tokenize(item.title):
+            frequencies[term] += TITLE_WEIGHT
+        for term, frequency in frequencies.items():
+            self.postings[term][path] = frequency
+
+        length = sum(frequencies.values())
+        info = {
+            "project": item.project,
+            "id": item.id,
+            "kind": "epic" if isinstance(item, Epic) else "task",
+            "title": item.title,
+        }
+        self.docs[path] = (fingerprint, info, length)
+        self.doc_terms[path] = list(frequencies)
+        self.total_length += length
+
+    def remove(self, path: str) -> None:
+        """Drop one file from the index."""
+        doc = self.docs.pop(path, None)
+        if doc is None:
+            return
+        self.total_length -= doc[2]
+        for term in self.doc_terms.pop(path):
+            postings = self.postings[term]
+            postings.pop(path, None)
+            if not postings:
+                del self.postings[term]
+
+    def search(
+        self, query: str, project: str | None = None, limit: int = 20
+    ) -> dict[str, Any]:
+        """Return files containing every query term, ranked by BM25, with snippets."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.docs:
+            return {"total": 0, "hits": []}
+
+        term_postings = [self.postings.get(term, {}) for term in terms]
+        candidates = set(min(term_postings, key=len))
+        for postings in term_postings:
+            candidates.intersection_update(postings)
+        if project:
+            candidates = {path for path in candidates if self.docs[path][1]["project"] == project}
+
+        doc_count = len(self.docs)
+        average_length = self.total_length / doc_count or 1
+        scores = []
+        for path in candidates:
+            length = self.docs[path][2]
+            score = 0.0
+            for postings in term_postings:
+                frequency = postings[path]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                score += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+            scores.append((score, path))
+        scores.sort(key=lambda item: (-item[0], item[1]))
+
+        hits = []
+        for score, path in scores[:limit]:
+            try:
+                content = Path(path).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                content = ""
+            hits.append(
+                {
+                    **self.docs[path][1],
+                    "score": round(score, 4),
+                    "snippet": make_snippet(content, terms),
+                }
+            )
+        return {"total": len(scores), "hits": hits}
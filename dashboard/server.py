@@ -10,119 +10,1074 @@ A lightweight HTTP server for viewing epics and tasks across multiple projects.
 Usage:
     uv run python dashboard/server.py --projects proj1,proj2,proj3
     uv run python dashboard/server.py --dir /path/to/projects
+    uv run python dashboard/server.py --dir /path/to/projects --workers 16
+    uv run python dashboard/server.py --dir /path/to/projects --async
+    uv run python dashboard/server.py --dir /path/to/projects --export site/ --gzip
     DASHBOARD_PROJECTS=proj1,proj2 uv run python dashboard/server.py
 
-If no projects are specified, auto-discovers directories with /strategy/ folders.
+If no projects are specified, auto-discovers directories with /strategy/ folders
+up to --depth levels below --dir (e.g. ~/Code/org/repo/strategy), and keeps
+picking up added and removed projects while running.
 """
 
 import argparse
-import json
+import asyncio
+import hashlib
+import http.client
+import io
 import os
 import sys
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
 
 # Add dashboard directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from parser import scan_all_projects
+from discovery import DEFAULT_IGNORE, DEFAULT_MAX_DEPTH, ProjectDiscovery
+from export import export_dashboard
+from graph import LinkGraph
+from history import HistoryStore, default_history_path, parse_timestamp
+from metrics import SCAN_BUCKETS, SIZE_BUCKETS, Registry
+from parser import (
+    ScanStats,
+    export_parse_cache,
+    import_parse_cache,
+    load_project_details,
+    scan_all_projects,
+)
+from query import DEFAULT_LIMIT, FILTERS, MAX_LIMIT, RowIndex, StaleCursor
+from search import SearchIndex
+from snapshot import (
+    accepts_gzip,
+    build_aggregates,
+    changes_since,
+    coding_etag,
+    diff_snapshots,
+    GZIP_LEVEL,
+    encode_fragments,
+    encode_json,
+    encode_snapshot,
+    etag_matches,
+    iter_chunks,
+    with_task_counts,
+)
+from static import StaticFiles, not_modified_since
+from store import SnapshotStore, default_snapshot_path
 
 # Default configuration
 DEFAULT_PORT = 8080
+DEFAULT_WORKERS = 4
 CACHE_TTL = 5  # seconds
+HISTORY_RANGE = 30 * 24 * 3600  # seconds covered by /api/history without from=
+HISTORY_SIZE = 256  # snapshot versions whose changes are kept for deltas
+EVENTS_KEEPALIVE = 15  # seconds between keep-alive comments on /api/events
+CONNECTION_TIMEOUT = 60  # seconds an idle keep-alive connection is kept open
+LISTEN_BACKLOG = 1024  # pending connections queued by the listening socket
+MAX_REQUEST_HEAD = 64 * 1024  # bytes of request line and headers accepted
+# Answered from the in-memory snapshot, so --async runs them on the event
+# loop; every other request may touch the disk and runs on the executor
+LOOP_ENDPOINTS = frozenset(
+    {"/api/data", "/api/projects", "/api/epics", "/api/tasks", "/api/graph", "/api/metrics"}
+)
+# Browsers may keep static files but must revalidate them (cheap 304s)
+STATIC_CACHE_CONTROL = "no-cache"
+# The only files under dashboard/ served over HTTP (at "/<name>")
+STATIC_FILES = ("index.html",)
+
+# Paths reported as their own endpoint in request metrics. Every project's
+# details count as "/api/projects/<id>"; other paths are "static".
+ENDPOINTS = {
+    "/",
+    "/api/data",
+    "/api/events",
+    "/api/projects",
+    "/api/epics",
+    "/api/tasks",
+    "/api/search",
+    "/api/graph",
+    "/api/history",
+    "/api/metrics",
+    "/favicon.ico",
+}
 
 # Runtime configuration (set in main())
 PROJECTS_DIR: Path = Path(".")
 PROJECT_NAMES: list[str] = []
+SCAN_WORKERS: int = 1
+SCAN_PROCESSES: bool = False
+# Stream /api/data from per-row fragments instead of one pre-encoded body
+STREAM_SNAPSHOT: bool = False
+SNAPSHOT_STORE: SnapshotStore | None = None
+# Status and size counts over time, appended whenever a scan changes them
+HISTORY_STORE: HistoryStore | None = None
+# Set when projects are auto-discovered; re-run before every scan
+DISCOVERY: ProjectDiscovery | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """One published snapshot version and everything derived from it.
+
+    refresh_data builds a new Snapshot and publishes it with a single
+    assignment to ``_cache["snapshot"]``. A handler reads that once, so the
+    rows, encoded bodies, indexes, link graph and change history it serves
+    all belong to the same version.
+    """
+
+    data: dict
+    # Serialized /api/data bodies and ETag, or per-row fragments with --stream
+    encoded: dict
+    # "projects": id -> Project; "epics"/"tasks": RowIndex used by queries
+    indexes: dict
+    graph: LinkGraph
+    # (version, row changes) for the most recent versions, oldest first
+    history: tuple[tuple[int, dict], ...]
+
+    @property
+    def version(self) -> int:
+        return self.data["version"]
+
+
+# "snapshot" is the published Snapshot, whose version is bumped only when
+# the scanned tree actually changes; "timestamp" is the time of the last scan
+_cache: dict = {"snapshot": None, "timestamp": 0}
+
+# Encoded /api/projects/<id> responses: project id -> {"details_version",
+# "body"}, re-encoded when the project's details_version moves
+_details: dict[str, dict] = {}
+
+# Notified whenever a new snapshot version is published
+_changed = threading.Condition()
+
+# Held by the one thread rescanning the tree (single-flight refresh)
+_refresh_lock = threading.Lock()
+
+# --async mode: rescans run on this executor so the event loop never blocks,
+# and "changed" is an asyncio.Event set (and replaced) on every new version
+_refresh_executor: ThreadPoolExecutor | None = None
+_async_state: dict = {"loop": None, "changed": None}
 
-# Cache for parsed data
-_cache: dict = {"data": None, "timestamp": 0}
+# The dashboard's own files (index.html, ...), served from memory
+_static = StaticFiles(Path(__file__).parent, STATIC_FILES)
 
+# Full-text index over epic and task files, updated by every scan
+_search_index = SearchIndex()
 
-def get_data() -> dict:
-    """Get project data, using cache if still valid."""
+# Metrics served at /api/metrics
+_metrics = Registry()
+SCAN_SECONDS = _metrics.histogram(
+    "dashboard_scan_duration_seconds",
+    "Duration of full scans by phase (list, parse, total).",
+    ("phase",),
+    SCAN_BUCKETS,
+)
+REFRESH_SECONDS = _metrics.histogram(
+    "dashboard_refresh_stage_duration_seconds",
+    "Duration of snapshot refresh stages after the scan.",
+    ("stage",),
+    SCAN_BUCKETS,
+)
+LAST_SCAN_SECONDS = _metrics.gauge(
+    "dashboard_last_scan_duration_seconds", "Duration of the most recent scan."
+)
+PROJECT_SCAN_SECONDS = _metrics.gauge(
+    "dashboard_project_scan_duration_seconds",
+    "Listing plus parse time per project in the most recent scan.",
+    ("project",),
+)
+SLOWEST_FILE_SECONDS = _metrics.gauge(
+    "dashboard_slowest_file_parse_seconds",
+    "Parse time of the slowest files in the most recent scan that parsed any.",
+    ("path",),
+)
+FILES_SCANNED = _metrics.counter(
+    "dashboard_scan_files_total",
+    "Files visited by scans, parsed or skipped as unchanged.",
+    ("result",),
+)
+CACHE_LOOKUPS = _metrics.counter(
+    "dashboard_cache_lookups_total",
+    "get_snapshot calls by outcome: hit (fresh), stale (served while a refresh "
+    "runs elsewhere) or miss (waited for a refresh).",
+    ("result",),
+)
+REFRESHES = _metrics.counter(
+    "dashboard_refreshes_total", "Rescans, by whether they published a new version.", ("changed",)
+)
+CURRENT_VERSION = _metrics.gauge("dashboard_snapshot_version", "Current snapshot version.")
+SNAPSHOT_ROWS = _metrics.gauge("dashboard_snapshot_rows", "Rows in the current snapshot.", ("kind",))
+SNAPSHOT_BYTES = _metrics.gauge(
+    "dashboard_snapshot_bytes", "Size of the encoded /api/data body.", ("encoding",)
+)
+REQUEST_SECONDS = _metrics.histogram(
+    "dashboard_request_duration_seconds", "Request handling time by endpoint.", ("endpoint",)
+)
+RESPONSE_BYTES = _metrics.histogram(
+    "dashboard_response_size_bytes",
+    "Size of response bodies by endpoint.",
+    ("endpoint",),
+    SIZE_BUCKETS,
+)
+REQUESTS = _metrics.counter(
+    "dashboard_requests_total", "Requests by endpoint and status code.", ("endpoint", "status")
+)
+
+
+def is_stale() -> bool:
+    """Return True if the cached snapshot is missing or older than CACHE_TTL."""
+    return _cache["snapshot"] is None or (time.time() - _cache["timestamp"]) > CACHE_TTL
+
+
+def refresh_data() -> None:
+    """Rescan all projects and publish a new snapshot version if anything changed."""
+    global PROJECT_NAMES
     now = time.time()
-    if _cache["data"] is None or (now - _cache["timestamp"]) > CACHE_TTL:
-        projects, epics, tasks = scan_all_projects(PROJECTS_DIR, PROJECT_NAMES)
-        _cache["data"] = {
-            "projects": [p.to_dict() for p in projects],
-            "epics": [e.to_dict() for e in epics],
-            "tasks": [t.to_dict() for t in tasks],
-            "refreshedAt": datetime.now(timezone.utc).isoformat(),
+    if DISCOVERY:
+        # Only re-lists directories whose mtime changed since the last run
+        discover_start = time.perf_counter()
+        PROJECT_NAMES = DISCOVERY.discover()
+        record_stage("discover", discover_start)
+    stats = ScanStats()
+    projects, epics, tasks = scan_all_projects(
+        PROJECTS_DIR, PROJECT_NAMES, SCAN_WORKERS, SCAN_PROCESSES, stats
+    )
+    record_scan(stats)
+    stage_start = time.perf_counter()
+    with _search_index.lock:
+        if _cache["snapshot"] is None:
+            # Also covers files the first scan took from the snapshot store
+            _search_index.sync(export_parse_cache())
+        else:
+            _search_index.update(stats.parsed, stats.evicted)
+    stage_start = record_stage("search", stage_start)
+    data = {
+        # Rows stay models; encode_snapshot serializes them directly
+        "projects": projects,
+        "epics": epics,
+        "tasks": tasks,
+        "refreshedAt": datetime.now(timezone.utc).isoformat(),
+    }
+    # Epic -> task ids join and status/size counts, so clients never match
+    # tasks to epics themselves
+    data.update(build_aggregates(data["epics"], data["tasks"]))
+    stage_start = record_stage("aggregate", stage_start)
+    if SNAPSHOT_STORE:
+        SNAPSHOT_STORE.save(export_parse_cache())
+        stage_start = record_stage("persist", stage_start)
+    current: Snapshot | None = _cache["snapshot"]
+    changes = diff_snapshots(current.data, data) if current else None
+    stage_start = record_stage("diff", stage_start)
+    REFRESHES.inc(changed=str(current is None or changes is not None).lower())
+    if current is None or changes:
+        version = (current.version if current else 0) + 1
+        data["version"] = version
+        if STREAM_SNAPSHOT:
+            encoded = encode_fragments(data, current.encoded if current else None)
+        else:
+            encoded = encode_snapshot(data)
+        stage_start = record_stage("encode", stage_start)
+        indexes = {
+            "projects": {project.id: project for project in data["projects"]},
+            "epics": RowIndex(data["epics"], version),
+            "tasks": RowIndex(data["tasks"], version),
         }
-        _cache["timestamp"] = now
-    return _cache["data"]
+        stage_start = record_stage("index", stage_start)
+        graph = (current.graph if current else LinkGraph()).update(data, changes)
+        stage_start = record_stage("graph", stage_start)
+        history = current.history if current else ()
+        if changes:
+            history = (*history, (version, changes))[-HISTORY_SIZE:]
+        # Everything derived from this version becomes visible at once
+        _cache["snapshot"] = Snapshot(data, encoded, indexes, graph, history)
+        # list() copies the keys in one step; request threads insert meanwhile
+        for project_id in list(_details):
+            if project_id not in indexes["projects"]:
+                _details.pop(project_id, None)
+        CURRENT_VERSION.set(version)
+        for kind in ("projects", "epics", "tasks"):
+            SNAPSHOT_ROWS.set(len(data[kind]), kind=kind)
+        if STREAM_SNAPSHOT:
+            SNAPSHOT_BYTES.set(encoded["length"], encoding="identity")
+        else:
+            SNAPSHOT_BYTES.set(len(encoded["body"]), encoding="identity")
+            SNAPSHOT_BYTES.set(len(encoded["gzip"]), encoding="gzip")
+        with _changed:
+            _changed.notify_all()
+        loop = _async_state["loop"]
+        if loop is not None:
+            loop.call_soon_threadsafe(publish_async_change)
+        if HISTORY_STORE:
+            stage_start = time.perf_counter()
+            HISTORY_STORE.record(data["counts"], now)
+            record_stage("history", stage_start)
+    _cache["timestamp"] = now
+
+
+def refresh_if_stale(blocking: bool = False) -> bool:
+    """Rescan if the snapshot is stale, unless another thread already is.
+
+    Returns False without scanning if the refresh lock is taken and
+    ``blocking`` is false.
+    """
+    if not _refresh_lock.acquire(blocking=blocking):
+        return False
+    try:
+        # Another thread may have finished a scan while we waited
+        if is_stale():
+            refresh_data()
+    finally:
+        _refresh_lock.release()
+    return True
+
+
+def get_snapshot() -> Snapshot:
+    """Get the current snapshot, rescanning first if it is stale.
+
+    When the cache expires, exactly one caller rescans. Concurrent callers
+    keep getting the previous snapshot, or wait for the in-flight scan if
+    there is no snapshot yet. In --async mode the rescan is handed to the
+    refresh executor and the caller always gets the current snapshot.
+    """
+    if not is_stale():
+        CACHE_LOOKUPS.inc(result="hit")
+        return _cache["snapshot"]
+    if _refresh_executor is not None and _cache["snapshot"] is not None:
+        if not _refresh_lock.locked():
+            _refresh_executor.submit(refresh_if_stale)
+        CACHE_LOOKUPS.inc(result="stale")
+        return _cache["snapshot"]
+    if not refresh_if_stale(blocking=_cache["snapshot"] is None):
+        CACHE_LOOKUPS.inc(result="stale")
+        return _cache["snapshot"]
+    CACHE_LOOKUPS.inc(result="miss")
+    return _cache["snapshot"]
+
+
+def run_export(out_dir: Path, shards: bool, compress: bool) -> None:
+    """Scan once and write the dashboard as static files to out_dir.
+
+    Parsed files are kept in the snapshot store between runs, so a
+    re-export only re-parses files that changed, and only output files
+    whose content changed are rewritten.
+    """
+    start = time.perf_counter()
+    stats = ScanStats()
+    projects, epics, tasks = scan_all_projects(
+        PROJECTS_DIR, PROJECT_NAMES, SCAN_WORKERS, SCAN_PROCESSES, stats
+    )
+    if SNAPSHOT_STORE:
+        SNAPSHOT_STORE.save(export_parse_cache())
+    index_html = (Path(__file__).parent / "index.html").read_bytes()
+    summary = export_dashboard(
+        out_dir,
+        projects,
+        epics,
+        tasks,
+        index_html,
+        lambda project: load_project_details(PROJECTS_DIR / project.id, project.id),
+        shards=shards,
+        compress=compress,
+    )
+    print(
+        f"Exported {len(projects)} projects, {len(epics)} epics, {len(tasks)} tasks "
+        f"to {out_dir} (version {summary['version']})"
+    )
+    print(
+        f"Parsed {stats.files_parsed} files, skipped {stats.files_skipped} unchanged; "
+        f"wrote {len(summary['written'])} of {summary['files']} files, "
+        f"removed {len(summary['removed'])} in {time.perf_counter() - start:.2f}s"
+    )
+
+
+def record_scan(stats: ScanStats) -> None:
+    """Publish the timings and counts of one scan as metrics."""
+    SCAN_SECONDS.observe(stats.list_duration, phase="list")
+    SCAN_SECONDS.observe(stats.parse_duration, phase="parse")
+    SCAN_SECONDS.observe(stats.duration, phase="total")
+    LAST_SCAN_SECONDS.set(stats.duration)
+    FILES_SCANNED.inc(stats.files_parsed, result="parsed")
+    FILES_SCANNED.inc(stats.files_skipped, result="skipped")
+    PROJECT_SCAN_SECONDS.replace(
+        {(name,): seconds for name, seconds in stats.project_durations.items()}
+    )
+    if stats.slowest_files:
+        SLOWEST_FILE_SECONDS.replace(
+            {(path,): seconds for seconds, path in stats.slowest_files}
+        )
+
+
+def record_stage(stage: str, start: float) -> float:
+    """Observe the duration of a refresh stage begun at start; return the time now."""
+    now = time.perf_counter()
+    REFRESH_SECONDS.observe(now - start, stage=stage)
+    return now
+
+
+def get_delta(snapshot: Snapshot, since: int) -> dict | None:
+    """Return the added, updated and removed rows between version since and snapshot.
+
+    Returns None when that version is no longer in the snapshot's change history.
+    """
+    changes = changes_since(snapshot.history, since, snapshot.version)
+    if changes is None:
+        return None
+    return {
+        "delta": True,
+        "version": snapshot.version,
+        "since": since,
+        "refreshedAt": snapshot.data["refreshedAt"],
+        **changes,
+    }
+
+
+def publish_async_change() -> None:
+    """Wake every --async event stream; runs on the event loop."""
+    changed = _async_state["changed"]
+    _async_state["changed"] = asyncio.Event()
+    changed.set()
+
+
+def format_event(snapshot: Snapshot, since: int) -> bytes:
+    """Build a Server-Sent Events "change" message moving a client to snapshot.
 
+    Carries the row delta from the client's version when it is still in the
+    change history; otherwise tells the client to reload the full snapshot.
+    """
+    payload = get_delta(snapshot, since) or {
+        "full": True,
+        "version": snapshot.version,
+        "since": since,
+        "refreshedAt": snapshot.data["refreshedAt"],
+    }
+    header = f"id: {snapshot.version}\nevent: change\ndata: ".encode("utf-8")
+    return header + encode_json(payload) + b"\n\n"
 
-class DashboardHandler(SimpleHTTPRequestHandler):
+
+class DashboardHandler(BaseHTTPRequestHandler):
     """Custom handler for the dashboard server."""
 
-    def __init__(self, *args, **kwargs):
-        # Set the directory to serve static files from
-        super().__init__(*args, directory=str(Path(__file__).parent), **kwargs)
+    # Keep-alive connections, and chunked responses when streaming
+    protocol_version = "HTTP/1.1"
+    timeout = CONNECTION_TIMEOUT
 
     def do_GET(self):
-        if self.path == "/":
+        """Route the request, recording its latency, status and size."""
+        path = urlsplit(self.path).path
+        if path in ENDPOINTS:
+            endpoint = path
+        elif path.startswith("/api/projects/"):
+            endpoint = "/api/projects/<id>"
+        else:
+            endpoint = "static"
+        self.status_code = None
+        self.response_bytes = None
+        start = time.perf_counter()
+        try:
+            self.route(path)
+        finally:
+            REQUESTS.inc(endpoint=endpoint, status=str(self.status_code))
+            # Event streams stay open for as long as the client listens
+            if endpoint != "/api/events":
+                REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=endpoint)
+            if self.response_bytes is not None:
+                RESPONSE_BYTES.observe(self.response_bytes, endpoint=endpoint)
+
+    def route(self, path: str):
+        if path == "/":
             self.serve_index()
-        elif self.path == "/api/data":
+        elif path == "/api/data":
             self.serve_api_data()
-        elif self.path == "/favicon.ico":
+        elif path == "/api/events":
+            self.serve_events()
+        elif path == "/api/projects":
+            self.serve_projects()
+        elif path.startswith("/api/projects/"):
+            self.serve_project_details(unquote(path.removeprefix("/api/projects/")))
+        elif path in ("/api/epics", "/api/tasks"):
+            self.serve_query(path.removeprefix("/api/"))
+        elif path == "/api/search":
+            self.serve_search()
+        elif path == "/api/graph":
+            self.serve_graph()
+        elif path == "/api/history":
+            self.serve_history()
+        elif path == "/api/metrics":
+            self.serve_metrics()
+        elif path == "/favicon.ico":
             # Return empty response for favicon requests
             self.send_response(204)
             self.end_headers()
-        else:
-            super().do_GET()
+        elif not self.serve_static(path):
+            self.send_error(404, "Not found")
+
+    def send_response(self, code, message=None):
+        self.status_code = code
+        super().send_response(code, message)
+
+    def send_header(self, keyword, value):
+        if keyword.lower() == "content-length":
+            self.response_bytes = int(value)
+        super().send_header(keyword, value)
 
     def serve_index(self):
         """Serve the main index.html file."""
-        index_path = Path(__file__).parent / "index.html"
-        try:
-            content = index_path.read_bytes()
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", len(content))
-            self.end_headers()
-            self.wfile.write(content)
-        except FileNotFoundError:
+        if not self.serve_static("/index.html"):
             self.send_error(404, "index.html not found")
 
+    def serve_static(self, path: str) -> bool:
+        """Serve a dashboard file from the in-memory cache.
+
+        Returns False if there is no such file. Clients revalidate with the
+        ETag or Last-Modified and get 304 when the file is unchanged.
+        """
+        asset = _static.get(path)
+        if asset is None:
+            return False
+        use_gzip = asset["gzip"] is not None and accepts_gzip(
+            self.headers.get("Accept-Encoding")
+        )
+        etag = coding_etag(asset["etag"], use_gzip)
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            if self.send_not_modified(etag):
+                return True
+        elif not_modified_since(self.headers.get("If-Modified-Since"), asset["mtime"]):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", asset["last_modified"])
+            self.send_header("Cache-Control", STATIC_CACHE_CONTROL)
+            self.end_headers()
+            return True
+
+        content = asset["gzip"] if use_gzip else asset["body"]
+        self.send_response(200)
+        self.send_header("Content-Type", asset["content_type"])
+        self.send_header("Content-Length", len(content))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if asset["gzip"] is not None:
+            self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", asset["last_modified"])
+        self.send_header("Cache-Control", STATIC_CACHE_CONTROL)
+        self.end_headers()
+        self.wfile.write(content)
+        return True
+
     def serve_api_data(self):
-        """Serve the JSON API data."""
-        data = get_data()
-        content = json.dumps(data, indent=2).encode("utf-8")
+        """Serve the JSON API data.
+
+        The full body is encoded once per snapshot; clients revalidate with
+        the ETag and get gzip when they accept it. With ``?since=<version>``
+        only the rows changed after that version are returned, falling back
+        to the full snapshot when the version is no longer in the history.
+        In streaming mode the snapshot is written from per-row fragments.
+        """
+        snapshot = get_snapshot()
+        encoded = snapshot.encoded
+        since = parse_qs(urlsplit(self.path).query).get("since", [""])[0]
+        if since.isdigit():
+            delta = get_delta(snapshot, int(since))
+            if delta is not None:
+                self.send_json(encode_json(delta))
+                return
+        if STREAM_SNAPSHOT:
+            self.send_json_stream(encoded)
+        else:
+            self.send_json(encoded["body"], encoded["gzip"], encoded["etag"])
+
+    def serve_projects(self):
+        """Serve the list of projects in the current snapshot."""
+        data = get_snapshot().data
+        payload = {
+            "version": data["version"],
+            "refreshedAt": data["refreshedAt"],
+            "items": data["projects"],
+        }
+        self.send_json_payload(payload)
+
+    def serve_project_details(self, project_id: str):
+        """Serve one project's vision and OKRs.
+
+        The files are parsed on the first request after they change, and the
+        ETag is the project's details_version, so a revalidating client whose
+        copy matches the snapshot gets 304 without anything being read. A
+        body is cached and sent under the details_version of the files it
+        was parsed from, which is newer than the snapshot's if they changed
+        since the last scan.
+        """
+        project = get_snapshot().indexes["projects"].get(project_id)
+        if project is None:
+            self.send_error(404, f"Unknown project: {project_id}")
+            return
+        if self.send_not_modified(f'"{project.details_version or "none"}"'):
+            return
+        encoded = _details.get(project_id)
+        if encoded is None or encoded["details_version"] != project.details_version:
+            details = load_project_details(PROJECTS_DIR / project_id, project_id)
+            encoded = {
+                "details_version": details.details_version,
+                "body": encode_json(details),
+            }
+            _details[project_id] = encoded
+        self.send_json(encoded["body"], etag=f'"{encoded["details_version"] or "none"}"')
+
+    def serve_query(self, kind: str):
+        """Serve one page of epics or tasks, filtered through the snapshot indexes.
+
+        Accepts project, status, epic, size (tasks only) and q filters plus
+        limit/cursor pagination; the response carries the total match count and the cursor
+        of the next page. Epic rows come with the todo/done counts of all
+        their tasks from the snapshot aggregates. A cursor from an earlier snapshot version gets 409,
+        as the rows it points into have moved.
+        """
+        snapshot = get_snapshot()
+        index = snapshot.indexes[kind]
+        params = {
+            key: values[0]
+            for key, values in parse_qs(urlsplit(self.path).query).items()
+        }
+        try:
+            limit = min(int(params.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
+            cursor = index.parse_cursor(params.get("cursor"))
+        except StaleCursor:
+            self.send_error(409, "Cursor is from an older snapshot; reload the first page")
+            return
+        except ValueError:
+            self.send_error(400, "limit must be an integer and cursor a next_cursor value")
+            return
+        if limit < 1:
+            self.send_error(400, "limit must be positive")
+            return
+        unsupported = [
+            name for name in ("epic", "size") if params.get(name) and name not in FILTERS[kind]
+        ]
+        if unsupported:
+            self.send_error(400, f"{kind} cannot be filtered by {', '.join(unsupported)}")
+            return
+
+        result = index.query(
+            project=params.get("project"),
+            status=params.get("status"),
+            epic=params.get("epic"),
+            size=params.get("size"),
+            q=params.get("q"),
+            limit=limit,
+            cursor=cursor,
+        )
+        if kind == "epics":
+            epic_counts = snapshot.data["counts"]["epics"]
+            result["items"] = [with_task_counts(epic, epic_counts) for epic in result["items"]]
+        self.send_json_payload({"version": snapshot.version, **result})
+
+    def serve_search(self):
+        """Serve ranked full-text matches over epic and task titles and bodies.
+
+        Accepts q (required), project and limit. Every scan updates the
+        index with the files it parsed or evicted, so searching reads nothing
+        but the snippets of the hits.
+        """
+        version = get_snapshot().version
+        params = {
+            key: values[0]
+            for key, values in parse_qs(urlsplit(self.path).query).items()
+        }
+        try:
+            limit = min(int(params.get("limit", 20)), MAX_LIMIT)
+        except ValueError:
+            self.send_error(400, "limit must be an integer")
+            return
+
+        with _search_index.lock:
+            result = _search_index.search(
+                params.get("q", ""), project=params.get("project"), limit=max(limit, 1)
+            )
+        self.send_json_payload(
+            {"version": version, "query": params.get("q", ""), **result}
+        )
+
+    def serve_graph(self):
+        """Serve the epic <-> task link graph and the inconsistencies found in it.
+
+        Without parameters, returns every project's issues (checklist vs task
+        status mismatches, tasks listed under the wrong epic, orphan tasks
+        and dangling links). With ``project``, returns that project's full
+        graph, including the edges in both directions.
+        """
+        snapshot = get_snapshot()
+        project = parse_qs(urlsplit(self.path).query).get("project", [""])[0]
+        if project:
+            graph = snapshot.graph.projects.get(project)
+            if graph is None:
+                self.send_error(404, f"Unknown project: {project}")
+                return
+            self.send_json_payload({"version": snapshot.version, **graph})
+            return
+        self.send_json_payload(
+            {"version": snapshot.version, "projects": snapshot.graph.summary()}
+        )
+
+    def serve_history(self):
+        """Serve the status and size counts of one project or epic over time.
+
+        Accepts project (all projects when omitted), epic, and from/to as
+        unix seconds or ISO 8601 (default: the last 30 days). Each point
+        holds the counts from its ts until the next point; the first is the
+        one in effect at from. resolution is 0 for per-scan points, else the
+        bucket size in seconds they were thinned to.
+        """
+        if HISTORY_STORE is None:
+            self.send_error(404, "History is disabled (--no-history)")
+            return
+        params = {
+            key: values[0]
+            for key, values in parse_qs(urlsplit(self.path).query).items()
+        }
+        try:
+            end = parse_timestamp(params["to"]) if "to" in params else int(time.time())
+            start = parse_timestamp(params["from"]) if "from" in params else end - HISTORY_RANGE
+        except ValueError:
+            self.send_error(400, "from and to must be unix seconds or ISO 8601 times")
+            return
+        project = params.get("project", "")
+        epic = params.get("epic", "")
+        points = HISTORY_STORE.query(project, epic, start, end)
+        self.send_json_payload(
+            {"project": project, "epic": epic, "from": start, "to": end, "points": points}
+        )
+
+    def serve_metrics(self):
+        """Serve scan, cache and request metrics in the Prometheus text format."""
+        content = _metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", len(content))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(content)
+
+    def send_json_payload(self, payload: dict):
+        """Encode a JSON payload and send it with a content-derived ETag."""
+        content = encode_json(payload)
+        etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+        self.send_json(content, etag=etag)
+
+    def send_json(
+        self, content: bytes, gzip_content: bytes | None = None, etag: str | None = None
+    ):
+        """Send a JSON body, using the gzip variant if given and accepted.
+
+        ``etag`` identifies the identity body; the gzip body is sent with its
+        own. Answers with 304 Not Modified when the client already has it.
+        """
+        use_gzip = gzip_content is not None and accepts_gzip(
+            self.headers.get("Accept-Encoding")
+        )
+        if etag:
+            etag = coding_etag(etag, use_gzip)
+            if self.send_not_modified(etag):
+                return
+
+        if use_gzip:
+            content = gzip_content
         self.send_response(200)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", len(content))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if gzip_content is not None:
+            self.send_header("Vary", "Accept-Encoding")
+        if etag:
+            self.send_header("ETag", etag)
         self.send_header("Cache-Control", "no-cache")
         self.end_headers()
         self.wfile.write(content)
 
+    def send_not_modified(self, etag: str) -> bool:
+        """Send 304 Not Modified if the client already has the ETag."""
+        if not etag_matches(self.headers.get("If-None-Match"), etag):
+            return False
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        return True
+
+    def send_json_stream(self, encoded: dict):
+        """Write a snapshot from its fragments, a chunk at a time.
+
+        HTTP/1.1 clients get chunked transfer encoding; gzip is compressed on
+        the fly, so memory per request stays at about one chunk however large
+        the snapshot is.
+        """
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding"))
+        etag = coding_etag(encoded["etag"], use_gzip)
+        if self.send_not_modified(etag):
+            return
+        chunked = self.request_version == "HTTP/1.1"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        elif not use_gzip:
+            self.send_header("Content-Length", encoded["length"])
+        else:
+            # HTTP/1.0 and unknown compressed length: the body ends at close
+            self.close_connection = True
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31) if use_gzip else None
+        written = 0
+
+        def write(data: bytes):
+            nonlocal written
+            if not data:
+                return
+            if chunked:
+                self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+            else:
+                self.wfile.write(data)
+            written += len(data)
+
+        for chunk in iter_chunks(encoded["fragments"]):
+            write(compressor.compress(chunk) if compressor else chunk)
+        if compressor:
+            write(compressor.flush())
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+        self.response_bytes = written
+
+    def serve_events(self):
+        """Stream snapshot changes to the client as Server-Sent Events.
+
+        The client's current version comes from Last-Event-ID (set by the
+        browser on reconnect) or the ``since`` query parameter. An event is
+        only written when the scanned tree changes; otherwise the stream
+        stays idle apart from periodic keep-alive comments.
+        """
+        snapshot = get_snapshot()
+        query = parse_qs(urlsplit(self.path).query)
+        since = self.headers.get("Last-Event-ID") or query.get("since", [""])[0]
+        try:
+            client_version = int(since)
+        except ValueError:
+            client_version = snapshot.version
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        last_write = time.time()
+        try:
+            while True:
+                snapshot = _cache["snapshot"]
+                if snapshot.version != client_version:
+                    self.wfile.write(format_event(snapshot, client_version))
+                    self.wfile.flush()
+                    client_version = snapshot.version
+                    last_write = time.time()
+                elif time.time() - last_write >= EVENTS_KEEPALIVE:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    last_write = time.time()
+                with _changed:
+                    _changed.wait(timeout=CACHE_TTL)
+                get_snapshot()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
     def log_message(self, format, *args):
         """Suppress default logging for cleaner output."""
         # args[0] might be a string (request path) or HTTPStatus (error code)
-        if args and isinstance(args[0], str) and "/api/data" in args[0]:
+        if args and isinstance(args[0], str) and "/api/" in args[0]:
             return  # Suppress API request logs
         super().log_message(format, *args)
 
 
-def discover_projects(projects_dir: Path) -> list[str]:
-    """Auto-discover projects with /strategy/ folders."""
-    discovered = []
-    if not projects_dir.exists():
-        return discovered
+class DashboardServer(ThreadingHTTPServer):
+    """One thread per connection, with room to queue a burst of them.
+
+    An SSE change event makes every open tab refetch at once; socketserver's
+    default backlog of 5 drops most of that burst into SYN retries.
+    """
+
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+
+class TransportWriter:
+    """Minimal wfile handing DashboardHandler output to an asyncio transport.
+
+    For handlers running on the event loop: output is queued on the
+    transport and drained once the handler returns.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+
+    def write(self, data: bytes) -> int:
+        self.writer.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class DrainingWriter(TransportWriter):
+    """wfile for a DashboardHandler running on an executor thread.
+
+    Every write is handed to the event loop and waits until the transport
+    has drained, so a slow client holds about one chunk of a streamed
+    response rather than all of it.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, loop: asyncio.AbstractEventLoop):
+        super().__init__(writer)
+        self.loop = loop
+
+    def write(self, data: bytes) -> int:
+        asyncio.run_coroutine_threadsafe(self.send(data), self.loop).result()
+        return len(data)
+
+    async def send(self, data: bytes) -> None:
+        self.writer.write(data)
+        await self.writer.drain()
+
+
+def run_handler(head: bytes, peer: tuple, wfile) -> bool:
+    """Handle one request with DashboardHandler over in-memory streams.
+
+    ``head`` is the request line and headers. Returns True if the connection
+    should be closed afterwards.
+    """
+    handler = DashboardHandler.__new__(DashboardHandler)
+    handler.directory = str(Path(__file__).parent)
+    handler.client_address = peer
+    handler.server = None
+    handler.request = None
+    handler.rfile = io.BytesIO(head)
+    handler.wfile = wfile
+    handler.close_connection = True
+    handler.handle_one_request()
+    return handler.close_connection
+
+
+async def stream_events_async(writer: asyncio.StreamWriter, target: str, head: bytes):
+    """--async counterpart of DashboardHandler.serve_events.
+
+    An idle stream is just a suspended coroutine waiting for the next
+    version, so hundreds of them cost no threads.
+    """
+    snapshot = get_snapshot()
+    headers = http.client.parse_headers(io.BytesIO(head.split(b"\r\n", 1)[1]))
+    since = headers.get("Last-Event-ID") or parse_qs(urlsplit(target).query).get(
+        "since", [""]
+    )[0]
+    try:
+        client_version = int(since)
+    except ValueError:
+        client_version = snapshot.version
+
+    writer.write(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/event-stream\r\n"
+        b"Cache-Control: no-cache\r\n"
+        b"Connection: close\r\n\r\n"
+    )
+    REQUESTS.inc(endpoint="/api/events", status="200")
+    last_write = time.time()
+    while True:
+        changed = _async_state["changed"]
+        snapshot = _cache["snapshot"]
+        if snapshot.version != client_version:
+            writer.write(format_event(snapshot, client_version))
+            client_version = snapshot.version
+            last_write = time.time()
+        elif time.time() - last_write >= EVENTS_KEEPALIVE:
+            writer.write(b": keep-alive\n\n")
+            last_write = time.time()
+        await writer.drain()
+        try:
+            await asyncio.wait_for(changed.wait(), timeout=CACHE_TTL)
+        except asyncio.TimeoutError:
+            pass
+        get_snapshot()
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Serve keep-alive requests on one connection in --async mode."""
+    loop = asyncio.get_running_loop()
+    peer = writer.get_extra_info("peername") or ("", 0)
+    try:
+        while True:
+            try:
+                head = await asyncio.wait_for(
+                    reader.readuntil(b"\r\n\r\n"), timeout=CONNECTION_TIMEOUT
+                )
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                return
+            method, _, rest = head.partition(b" ")
+            target = rest.split(b" ", 1)[0].decode("latin-1")
+            path = urlsplit(target).path
+            if method == b"GET" and path == "/api/events":
+                await stream_events_async(writer, target, head)
+                return
+            if path in LOOP_ENDPOINTS and not (STREAM_SNAPSHOT and path == "/api/data"):
+                close = run_handler(head, peer, TransportWriter(writer))
+            else:
+                # Search, project details, history and static files read
+                # the disk or SQLite, and a streamed snapshot must wait for
+                # the client between chunks: keep them off the loop
+                close = await loop.run_in_executor(
+                    None, run_handler, head, peer, DrainingWriter(writer, loop)
+                )
+            await writer.drain()
+            # Request bodies are never read, so only GET/HEAD may keep the connection
+            if close or method not in (b"GET", b"HEAD"):
+                return
+    except ConnectionError:
+        return
+    finally:
+        writer.close()
+
 
-    for item in projects_dir.iterdir():
-        if item.is_dir() and (item / "strategy").is_dir():
-            discovered.append(item.name)
+async def serve_async(port: int) -> None:
+    """Serve the dashboard from a single asyncio event loop (--async).
 
-    return sorted(discovered)
+    Connections and event streams are coroutines; rescans run on a
+    dedicated refresh thread, and requests that read files or SQLite
+    (search, project details, history, static files) on the default executor.
+    """
+    global _refresh_executor
+    _async_state["loop"] = asyncio.get_running_loop()
+    _async_state["changed"] = asyncio.Event()
+    _refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh")
+    server = await asyncio.start_server(
+        handle_connection, port=port, backlog=LISTEN_BACKLOG, limit=MAX_REQUEST_HEAD
+    )
+    async with server:
+        await server.serve_forever()
 
 
 def main():
     """Run the dashboard server."""
-    global PROJECTS_DIR, PROJECT_NAMES
+    global PROJECTS_DIR, PROJECT_NAMES, SCAN_WORKERS, SCAN_PROCESSES, SNAPSHOT_STORE
+    global DISCOVERY, STREAM_SNAPSHOT, HISTORY_STORE
 
     parser = argparse.ArgumentParser(
         description="Strategy Dashboard Server",
@@ -132,6 +1087,7 @@ Examples:
   %(prog)s --projects myproject,another-project
   %(prog)s --dir ~/Code --projects proj1,proj2
   %(prog)s --dir ~/Code  # auto-discovers projects with /strategy/ folders
+  %(prog)s --dir ~/Code --depth 2 --ignore archive,tmp  # finds ~/Code/org/repo
   DASHBOARD_PROJECTS=proj1,proj2 %(prog)s
         """,
     )
@@ -160,23 +1116,132 @@ Examples:
         help="Comma-separated list of project directory names (or DASHBOARD_PROJECTS env var). "
         "If not specified, auto-discovers projects with /strategy/ folders.",
     )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=int(os.environ.get("DASHBOARD_DEPTH", DEFAULT_MAX_DEPTH)),
+        help=f"How many directory levels below --dir to search for projects "
+        f"(default: {DEFAULT_MAX_DEPTH}, or DASHBOARD_DEPTH env var)",
+    )
+    parser.add_argument(
+        "--ignore",
+        type=str,
+        default=os.environ.get("DASHBOARD_IGNORE", ""),
+        help="Comma-separated directory name patterns to skip during discovery, in "
+        f"addition to {', '.join(DEFAULT_IGNORE)} (or DASHBOARD_IGNORE env var)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=int(os.environ.get("DASHBOARD_WORKERS", DEFAULT_WORKERS)),
+        help=f"Worker threads used to scan projects and files (default: {DEFAULT_WORKERS}, "
+        "or DASHBOARD_WORKERS env var). Use 1 to scan sequentially.",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Parse changed files in a pool of --workers processes instead of threads "
+        "(helps when regex parsing, not file access, dominates a cold scan)",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        default=os.environ.get("DASHBOARD_ASYNC", "") not in ("", "0"),
+        help="Serve from one asyncio event loop instead of a thread per connection; "
+        "suits many long-lived /api/events clients (or DASHBOARD_ASYNC=1)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=os.environ.get("DASHBOARD_STREAM", "") not in ("", "0"),
+        help="Stream /api/data with chunked encoding from per-row fragments instead of "
+        "keeping whole plain and gzip bodies in memory (or DASHBOARD_STREAM=1)",
+    )
+    parser.add_argument(
+        "--export",
+        type=Path,
+        metavar="DIR",
+        help="Scan once, write index.html and data.json to DIR for any static file "
+        "server, and exit. Re-running rewrites only files that changed.",
+    )
+    parser.add_argument(
+        "--shards",
+        action="store_true",
+        help="With --export, also write one projects/<id>.json per project",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="With --export, also write a precompressed .gz next to every JSON "
+        "and HTML file",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=os.environ.get("DASHBOARD_SNAPSHOT"),
+        help="SQLite file that persists parsed files across restarts (default: "
+        "~/.cache/strategy-dashboard/snapshot-<dir hash>.sqlite3, or DASHBOARD_SNAPSHOT env var)",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Do not load or save the on-disk snapshot",
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=os.environ.get("DASHBOARD_HISTORY"),
+        help="SQLite file recording status and size counts over time for /api/history "
+        "(default: ~/.cache/strategy-dashboard/history-<dir hash>.sqlite3, or "
+        "DASHBOARD_HISTORY env var)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record count history (disables /api/history)",
+    )
     args = parser.parse_args()
 
     # Set global configuration
     PROJECTS_DIR = args.dir.resolve()
+    SCAN_WORKERS = max(1, args.workers)
+    SCAN_PROCESSES = args.processes
+    STREAM_SNAPSHOT = args.stream
 
     # Determine project names: CLI/env > auto-discovery
     if args.projects:
         PROJECT_NAMES = [p.strip() for p in args.projects.split(",") if p.strip()]
     else:
-        PROJECT_NAMES = discover_projects(PROJECTS_DIR)
+        ignore = [p.strip() for p in args.ignore.split(",") if p.strip()]
+        DISCOVERY = ProjectDiscovery(
+            PROJECTS_DIR, max(1, args.depth), (*DEFAULT_IGNORE, *ignore)
+        )
+        PROJECT_NAMES = DISCOVERY.discover()
         if not PROJECT_NAMES:
             print(f"No projects with /strategy/ folders found in: {PROJECTS_DIR}")
             print("Specify projects with --projects or DASHBOARD_PROJECTS env var")
             sys.exit(1)
 
-    # Initial scan to show stats
-    projects, epics, tasks = scan_all_projects(PROJECTS_DIR, PROJECT_NAMES)
+    # Reload parsed files from the last run; only files whose fingerprint
+    # changed since then are re-parsed by the initial scan
+    if not args.no_snapshot:
+        SNAPSHOT_STORE = SnapshotStore(
+            args.snapshot or default_snapshot_path(PROJECTS_DIR)
+        )
+        import_parse_cache(SNAPSHOT_STORE.load())
+
+    if not args.no_history:
+        HISTORY_STORE = HistoryStore(args.history or default_history_path(PROJECTS_DIR))
+
+    if args.export:
+        run_export(args.export.resolve(), args.shards, args.gzip)
+        return
+
+    # Initial scan seeds the cache served to the first request
+    refresh_data()
+    data = _cache["snapshot"].data
 
     print("Strategy Dashboard")
     print("=" * 40)
@@ -185,12 +1250,27 @@ Examples:
         print(f"Scanning (specified): {', '.join(PROJECT_NAMES)}")
     else:
         print(f"Scanning (auto-discovered): {', '.join(PROJECT_NAMES)}")
-    print(f"Found: {len(epics)} epics, {len(tasks)} tasks")
+    print(f"Found: {len(data['epics'])} epics, {len(data['tasks'])} tasks")
+    if SNAPSHOT_STORE:
+        print(f"Snapshot: {SNAPSHOT_STORE.path}")
+    if HISTORY_STORE:
+        print(f"History: {HISTORY_STORE.path}")
+    if args.use_async:
+        print("Serving: asyncio event loop")
     print("=" * 40)
     print(f"Dashboard running at http://localhost:{args.port}")
     print("Press Ctrl+C to stop\n")
 
-    server = HTTPServer(("", args.port), DashboardHandler)
+    if args.use_async:
+        try:
+            asyncio.run(serve_async(args.port))
+        except KeyboardInterrupt:
+            print("\nShutting down...")
+        return
+
+    # One thread per connection, so slow clients, long-lived /api/events
+    # streams and rescans never block other requests
+    server = DashboardServer(("", args.port), DashboardHandler)
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,305 @@
+"""Snapshot helpers for the strategy dashboard (change detection, encoding)."""
+
+import gzip
+import hashlib
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from models import Epic, Task
+
+GZIP_LEVEL = 6
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes written per chunk when streaming
+
+# Row kinds in a snapshot and the fields that identify a row of each kind
+ROW_KEYS: dict[str, tuple[str, ...]] = {
+    "projects": ("id",),
+    "epics": ("project", "id"),
+    "tasks": ("project", "id"),
+}
+
+
+def row_key(row: Any, fields: tuple[str, ...]) -> tuple:
+    """Return the identifying key of a snapshot row (a Project, Epic or Task)."""
+    return tuple(getattr(row, field) for field in fields)
+
+
+def json_default(obj: Any) -> Any:
+    """json.dumps hook serializing snapshot models."""
+    return obj.to_dict()
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a payload that may contain models as compact JSON."""
+    return json.dumps(payload, separators=(",", ":"), default=json_default).encode("utf-8")
+
+
+def build_aggregates(epics: list[Epic], tasks: list[Task]) -> dict[str, Any]:
+    """Precompute the epic -> task join and status/size counts for a snapshot.
+
+    Returns ``epic_tasks`` (project -> epic id -> task ids) and ``counts``
+    with global, per-project and per-epic counts by normalized state and
+    task size.
+    """
+    def new_counts() -> dict[str, dict[str, int]]:
+        return {"epics": defaultdict(int), "tasks": defaultdict(int), "sizes": defaultdict(int)}
+
+    global_counts = new_counts()
+    project_counts: dict[str, dict] = defaultdict(new_counts)
+    epic_counts: dict[str, dict[str, dict]] = defaultdict(dict)
+    epic_tasks: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+
+    for epic in epics:
+        for counts in (global_counts, project_counts[epic.project]):
+            counts["epics"][epic.state] += 1
+        epic_counts[epic.project][epic.id] = {
+            "tasks": defaultdict(int),
+            "sizes": defaultdict(int),
+        }
+
+    for task in tasks:
+        project, epic_id = task.project, task.epic_id
+        epic_tasks[project][epic_id].append(task.id)
+        counts_for_epic = epic_counts[project].get(epic_id)
+        for counts in (global_counts, project_counts[project], counts_for_epic):
+            if counts is not None:
+                counts["tasks"][task.state] += 1
+                counts["sizes"][task.size] += 1
+
+    return {
+        "epic_tasks": epic_tasks,
+        "counts": {
+            "global": global_counts,
+            "projects": project_counts,
+            "epics": epic_counts,
+        },
+    }
+
+
+def with_task_counts(epic: Epic, epic_counts: dict[str, dict]) -> dict[str, Any]:
+    """Return an epic row with the todo/done counts of its tasks.
+
+    ``epic_counts`` is ``counts["epics"]`` from build_aggregates, so clients
+    get every task of the epic counted without loading the tasks.
+    """
+    tasks = epic_counts.get(epic.project, {}).get(epic.id, {}).get("tasks", {})
+    return {**epic.to_dict(), "todo": tasks.get("todo", 0), "done": tasks.get("done", 0)}
+
+
+def diff_rows(old: list[Any], new: list[Any], fields: tuple[str, ...]) -> dict[str, list]:
+    """Compare two lists of rows and return the added, updated and removed rows.
+
+    Removed rows are reported by their key fields only.
+    """
+    old_rows = {row_key(row, fields): row for row in old}
+    new_keys = set()
+    added, updated = [], []
+    for row in new:
+        key = row_key(row, fields)
+        new_keys.add(key)
+        previous = old_rows.get(key)
+        if previous is None:
+            added.append(row)
+        elif previous is not row and previous != row:
+            updated.append(row)
+    removed = [
+        dict(zip(fields, key)) for key in old_rows if key not in new_keys
+    ]
+    return {"added": added, "updated": updated, "removed": removed}
+
+
+def diff_snapshots(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the row changes between two snapshots, or None if nothing changed."""
+    changes = {}
+    changed = False
+    for kind, fields in ROW_KEYS.items():
+        delta = diff_rows(old[kind], new[kind], fields)
+        changes[kind] = delta
+        changed = changed or any(delta.values())
+    return changes if changed else None
+
+
+def merge_changes(history: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Collapse consecutive snapshot changes into one net change.
+
+    A row added and later removed disappears; a row removed and re-added
+    becomes an update.
+    """
+    history = list(history)
+    merged = {}
+    for kind, fields in ROW_KEYS.items():
+        # key -> [existed before the first change, latest row or None]
+        states: dict[tuple, list] = {}
+        for changes in history:
+            delta = changes[kind]
+            for row in delta["added"]:
+                states.setdefault(row_key(row, fields), [False, None])[1] = row
+            for row in delta["updated"]:
+                states.setdefault(row_key(row, fields), [True, None])[1] = row
+            for removed_key in delta["removed"]:
+                key = tuple(removed_key[field] for field in fields)
+                states.setdefault(key, [True, None])[1] = None
+        added, updated, removed = [], [], []
+        for key, (existed, row) in states.items():
+            if row is None:
+                if existed:
+                    removed.append(dict(zip(fields, key)))
+            elif existed:
+                updated.append(row)
+            else:
+                added.append(row)
+        merged[kind] = {"added": added, "updated": updated, "removed": removed}
+    return merged
+
+
+def changes_since(
+    history: Iterable[tuple[int, dict[str, Any]]], since: int, version: int
+) -> dict[str, Any] | None:
+    """Return the net change from version ``since`` to ``version``.
+
+    ``history`` holds (version, changes) pairs in ascending order. Returns
+    None when the changes after ``since`` are no longer (or never were) in
+    the history, in which case the client needs a full snapshot.
+    """
+    if since > version:
+        return None
+    entries = [(v, changes) for v, changes in history if since < v <= version]
+    if len(entries) != version - since:
+        return None
+    return merge_changes(changes for _, changes in entries)
+
+
+def serialize_snapshot(data: dict[str, Any]) -> str:
+    """Write a snapshot as compact JSON.
+
+    Project, epic and task rows are written straight from the models with
+    to_json, so no per-row dicts are built; other keys go through json.
+    """
+    parts = []
+    for key, value in data.items():
+        if key in ROW_KEYS:
+            rows = ",".join([row.to_json() for row in value])
+            parts.append(f'"{key}":[{rows}]')
+        else:
+            parts.append(f'"{key}":{json.dumps(value, separators=(",", ":"))}')
+    return "{" + ",".join(parts) + "}"
+
+
+def encode_snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    """Serialize a snapshot once as compact JSON, gzip it and derive its ETag."""
+    body = serialize_snapshot(data).encode("utf-8")
+    return {
+        "body": body,
+        "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+    }
+
+
+def encode_fragments(
+    data: dict[str, Any], previous: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Pre-encode a snapshot as a list of JSON fragments for streaming.
+
+    Yields the same document as encode_snapshot, but each project, epic and
+    task row is its own fragment and no full body is ever built. Fragments
+    of rows that are the very objects encoded in ``previous`` are reused; the
+    snapshot ``previous`` was built from must still be alive for that.
+    """
+    reuse = previous["row_fragments"] if previous else {}
+    row_fragments: dict[int, bytes] = {}
+    fragments = [b"{"]
+    for i, (key, value) in enumerate(data.items()):
+        prefix = f'{"," if i else ""}"{key}":'
+        if key not in ROW_KEYS:
+            fragments.append(
+                (prefix + json.dumps(value, separators=(",", ":"))).encode("utf-8")
+            )
+            continue
+        fragments.append((prefix + "[").encode("utf-8"))
+        for position, row in enumerate(value):
+            fragment = reuse.get(id(row))
+            if fragment is None:
+                fragment = row.to_json().encode("utf-8")
+            row_fragments[id(row)] = fragment
+            if position:
+                fragments.append(b",")
+            fragments.append(fragment)
+        fragments.append(b"]")
+    fragments.append(b"}")
+
+    digest = hashlib.sha256()
+    for fragment in fragments:
+        digest.update(fragment)
+    return {
+        "fragments": fragments,
+        "row_fragments": row_fragments,
+        "length": sum(len(fragment) for fragment in fragments),
+        "etag": f'"{digest.hexdigest()[:32]}"',
+    }
+
+
+def iter_chunks(fragments: list[bytes], size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Join consecutive fragments into chunks of roughly ``size`` bytes."""
+    batch: list[bytes] = []
+    length = 0
+    for fragment in fragments:
+        batch.append(fragment)
+        length += len(fragment)
+        if length >= size:
+            yield b"".join(batch)
+            batch, length = [], 0
+    if batch:
+        yield b"".join(batch)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def coding_etag(etag: str, gzip: bool) -> str:
+    """Return the ETag of the identity or gzip representation of a body.
+
+    The two codings are different representations, so they must not share
+    a strong ETag: the gzip one gets a "-gz" suffix inside the quotes.
+    """
+    return f'{etag[:-1]}-gz"' if gzip else etag
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Return True if an Accept-Encoding header allows a gzip response.
+
+    An explicit gzip entry takes precedence over ``*``, so ``gzip, *;q=0``
+    allows gzip and ``gzip;q=0, *`` does not.
+    """
+    if not accept_encoding:
+        return False
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*") or name in qualities:
+            continue
+        quality = params.strip().lower().removeprefix("q=")
+        try:
+            qualities[name] = float(quality) if params else 1.0
+        except ValueError:
+            qualities[name] = 1.0
+    return qualities.get("gzip", qualities.get("*", 0)) > 0
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return True
+    return False
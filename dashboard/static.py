@@ -0,0 +1,96 @@
+"""In-memory cache of the dashboard's static files."""
+
+import gzip
+import hashlib
+import mimetypes
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from parser import file_fingerprint
+from snapshot import GZIP_LEVEL
+
+# Content types worth serving a gzip variant of
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def not_modified_since(if_modified_since: str | None, mtime: float) -> bool:
+    """Check an If-Modified-Since header value against a file mtime."""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+class StaticFiles:
+    """An allowlist of files in a directory, kept in memory with their gzip
+    variant and ETag.
+
+    Only ``names`` are ever served or cached, so the directory's other files
+    (the server's own source, for one) stay private and the cache cannot
+    grow past them. ``get`` costs one stat per request; a file is re-read
+    only when its (mtime, size) fingerprint changes.
+    """
+
+    def __init__(self, root: Path, names: tuple[str, ...]):
+        self.root = root.resolve()
+        self.names = frozenset(names)
+        self.lock = threading.Lock()
+        # absolute path -> loaded asset
+        self.files: dict[str, dict[str, Any]] = {}
+
+    def resolve(self, url_path: str) -> Path | None:
+        """Map a URL path to an allowlisted file under the root, or None."""
+        name = unquote(url_path).lstrip("/")
+        if name not in self.names:
+            return None
+        return self.root / name
+
+    def get(self, url_path: str) -> dict[str, Any] | None:
+        """Return the cached asset for a URL path, reloading it if it changed."""
+        path = self.resolve(url_path)
+        if path is None or not path.is_file():
+            return None
+        key = str(path)
+        fingerprint = file_fingerprint(path)
+        asset = self.files.get(key)
+        if asset is not None and asset["fingerprint"] == fingerprint:
+            return asset
+        if fingerprint is None:
+            with self.lock:
+                self.files.pop(key, None)
+            return None
+
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return None
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        compressed = None
+        if is_compressible(content_type):
+            compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+            if len(compressed) >= len(body):
+                compressed = None
+        asset = {
+            "fingerprint": fingerprint,
+            "body": body,
+            "gzip": compressed,
+            "content_type": content_type,
+            "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            "mtime": fingerprint[0] / 1e9,
+            "last_modified": formatdate(fingerprint[0] / 1e9, usegmt=True),
+        }
+        with self.lock:
+            self.files[key] = asset
+        return asset
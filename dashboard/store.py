@@ -0,0 +1,148 @@
+"""Persistent on-disk snapshot of parsed strategy files for warm startup."""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from models import Epic, KeyResult, Objective, Task, Vision
+
+# Bump when the parser's output changes so stale snapshots are discarded
+SNAPSHOT_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+"""
+
+
+def default_snapshot_path(projects_dir: Path) -> Path:
+    """Return the snapshot file used for a projects directory by default."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    digest = hashlib.sha1(str(projects_dir).encode("utf-8")).hexdigest()[:12]
+    return cache_home / "strategy-dashboard" / f"snapshot-{digest}.sqlite3"
+
+
+def from_fields(cls: type, values: dict[str, Any]) -> Any:
+    """Build a model from a to_dict() result, ignoring derived keys."""
+    return cls(**{f.name: values.get(f.name) for f in fields(cls) if f.init})
+
+
+def encode_result(result: Any) -> tuple[str, str] | None:
+    """Return (kind, JSON payload) for a parse result, or None if not storable."""
+    # Link fields are not part of the client-facing to_json
+    if isinstance(result, Epic):
+        return "epic", json.dumps({**result.to_dict(), "task_links": result.task_links})
+    if isinstance(result, Task):
+        return "task", json.dumps({**result.to_dict(), "epic_linked": result.epic_linked})
+    if isinstance(result, Vision):
+        return "vision", json.dumps(result.to_dict())
+    if isinstance(result, list):
+        return "okrs", json.dumps([objective.to_dict() for objective in result])
+    return None
+
+
+def decode_result(kind: str, payload: str) -> Any:
+    """Rebuild a parse result from its stored kind and JSON payload."""
+    values = json.loads(payload)
+    if kind == "epic":
+        return from_fields(Epic, values)
+    if kind == "task":
+        return from_fields(Task, values)
+    if kind == "vision":
+        return from_fields(Vision, values)
+    objectives = []
+    for objective in values:
+        key_results = objective.get("key_results")
+        objective = from_fields(Objective, objective)
+        if key_results:
+            objective.key_results = [from_fields(KeyResult, kr) for kr in key_results]
+        objectives.append(objective)
+    return objectives
+
+
+class SnapshotStore:
+    """SQLite file holding parsed results keyed by path and fingerprint.
+
+    Only rows whose fingerprint changed since the last save are written, so
+    persisting after a warm rescan is cheap.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # path -> fingerprint as last written to (or read from) disk
+        self._saved: dict[str, tuple[int, int]] = {}
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.executescript(SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(SNAPSHOT_VERSION):
+            with conn:
+                conn.execute("DELETE FROM files")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (str(SNAPSHOT_VERSION),),
+                )
+        return conn
+
+    def load(self) -> dict[str, tuple[tuple[int, int], Any]]:
+        """Read every stored entry as {path: (fingerprint, parse result)}."""
+        entries = {}
+        try:
+            with closing(self.connect()) as conn:
+                rows = conn.execute(
+                    "SELECT path, mtime_ns, size, kind, payload FROM files"
+                ).fetchall()
+        except sqlite3.Error:
+            return entries
+
+        for path, mtime_ns, size, kind, payload in rows:
+            try:
+                result = decode_result(kind, payload)
+            except (ValueError, TypeError, KeyError):
+                continue  # Unreadable entry: the file will simply be re-parsed
+            entries[path] = ((mtime_ns, size), result)
+            self._saved[path] = (mtime_ns, size)
+        return entries
+
+    def save(self, entries: dict[str, tuple[tuple[int, int], Any]]) -> None:
+        """Write entries that changed since the last save and drop removed ones."""
+        upserts = []
+        for path, (fingerprint, result) in entries.items():
+            if self._saved.get(path) == fingerprint:
+                continue
+            encoded = encode_result(result)
+            if encoded is not None:
+                upserts.append((path, *fingerprint, *encoded))
+        removed = [(path,) for path in self._saved if path not in entries]
+        if not upserts and not removed:
+            return
+
+        try:
+            with closing(self.connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size, kind, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                conn.executemany("DELETE FROM files WHERE path = ?", removed)
+        except sqlite3.Error as e:
+            print(f"Warning: could not save snapshot to {self.path}: {e}")
+            return
+
+        for path, mtime_ns, size, _, _ in upserts:
+            self._saved[path] = (mtime_ns, size)
+        for (path,) in removed:
+            del self._saved[path]
@@ -0,0 +1,6 @@
+"""The dashboard modules import each other by bare name, as server.py does."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
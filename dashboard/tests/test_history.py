@@ -0,0 +1,95 @@
+"""Recording and downsampling of the count history."""
+
+import sqlite3
+from contextlib import closing
+
+from history import HistoryStore
+
+HOUR = 3600
+DAY = 24 * HOUR
+NOW = 100 * DAY
+
+
+def counts(done: int) -> dict:
+    tasks = {"todo": 5 - done, "done": done}
+    return {
+        "global": {"tasks": tasks},
+        "projects": {"alpha": {"tasks": tasks}},
+        "epics": {"alpha": {"epic-001": {"tasks": tasks}}},
+    }
+
+
+def downsample(store: HistoryStore, now: int) -> None:
+    with closing(store.connect()) as conn, conn:
+        store.downsample(conn, now)
+
+
+def timestamps(store: HistoryStore, project: str = "", epic: str = "") -> list[tuple[int, int]]:
+    with closing(sqlite3.connect(store.path)) as conn:
+        return conn.execute(
+            "SELECT ts, resolution FROM samples WHERE project = ? AND epic = ? ORDER BY ts",
+            (project, epic),
+        ).fetchall()
+
+
+def test_only_changed_series_are_recorded(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    assert store.record(counts(1), now=NOW) == 3
+    assert store.record(counts(1), now=NOW + 60) == 0
+    assert store.record(counts(2), now=NOW + 120) == 3
+    assert [point["tasks"]["done"] for point in store.query(start=0, end=NOW + 120)] == [1, 2]
+
+
+def test_query_starts_with_the_sample_in_effect(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    store.record(counts(1), now=NOW)
+    store.record(counts(2), now=NOW + HOUR)
+    points = store.query(start=NOW + 60, end=NOW + 2 * HOUR)
+    assert [(point["ts"], point["tasks"]["done"]) for point in points] == [
+        (NOW, 1),
+        (NOW + HOUR, 2),
+    ]
+
+
+def test_removed_epic_is_marked_empty(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    store.record(counts(1), now=NOW)
+    removed = counts(1)
+    removed["epics"] = {}
+    assert store.record(removed, now=NOW + 60) == 1
+    assert store.query("alpha", "epic-001", start=0, end=NOW + 60)[-1] == {
+        "ts": NOW + 60,
+        "resolution": 0,
+    }
+
+
+def test_downsampling_keeps_the_last_sample_per_tier_bucket(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    # Every 20 minutes for three days before NOW, then one pass at NOW
+    start = NOW - 3 * DAY
+    for step in range(3 * 24 * 3):
+        store.record(counts(step % 5), now=start + step * 20 * 60)
+    downsample(store, NOW)
+
+    samples = timestamps(store)
+    recent = [ts for ts, resolution in samples if resolution == 0]
+    hourly = [ts for ts, resolution in samples if resolution == HOUR]
+    # The last day keeps every sample; the two days before it one per hour
+    assert len(recent) == 24 * 3 and min(recent) == NOW - DAY
+    assert len(hourly) == 2 * 24 and max(hourly) < NOW - DAY
+    # One sample per hour, and it is the last one recorded in that hour
+    assert len({ts // HOUR for ts in hourly}) == len(hourly)
+    assert all(ts % HOUR == 40 * 60 for ts in hourly)
+
+
+def test_downsampling_moves_old_samples_to_daily(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite3")
+    start = NOW - 40 * DAY
+    for step in range(10 * 4):
+        store.record(counts(step % 5), now=start + step * 6 * HOUR)
+    downsample(store, NOW)
+
+    samples = timestamps(store)
+    assert {resolution for _, resolution in samples} == {DAY}
+    assert len(samples) == 10
+    assert all(ts % DAY == 18 * HOUR for ts, _ in samples)
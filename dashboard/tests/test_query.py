@@ -0,0 +1,85 @@
+"""Filtering and cursor pagination of snapshot rows."""
+
+import pytest
+
+from models import Task
+from query import RowIndex, StaleCursor, intersect
+
+
+def make_tasks() -> list[Task]:
+    tasks = []
+    for number in range(10):
+        tasks.append(
+            Task(
+                id=f"task-{number:03d}",
+                title=f"Task {number}",
+                status="Done" if number % 3 == 0 else "Todo",
+                size="S" if number % 2 else "L",
+                project="alpha" if number < 6 else "beta",
+                epic_id=f"epic-{number % 2}",
+                file_path=f"/tmp/task-{number:03d}.md",
+            )
+        )
+    return tasks
+
+
+def pages(index: RowIndex, **filters) -> list[list[str]]:
+    """Follow next_cursor from the first page to the last."""
+    result = []
+    cursor = 0
+    while True:
+        page = index.query(cursor=cursor, **filters)
+        result.append([task.id for task in page["items"]])
+        if page["next_cursor"] is None:
+            return result
+        cursor = index.parse_cursor(page["next_cursor"])
+
+
+def test_intersect_keeps_positions_in_every_list():
+    assert intersect([1, 3, 5, 7], [[0, 1, 5, 7], [5, 6, 7]]) == [5, 7]
+    assert intersect([1, 2], [[]]) == []
+
+
+def test_pages_cover_every_match_once():
+    index = RowIndex(make_tasks(), version=4)
+    assert pages(index, limit=4) == [
+        ["task-000", "task-001", "task-002", "task-003"],
+        ["task-004", "task-005", "task-006", "task-007"],
+        ["task-008", "task-009"],
+    ]
+
+
+def test_filtered_pages_and_counts():
+    index = RowIndex(make_tasks(), version=1)
+    first = index.query(project="alpha", size="l", limit=2)
+    assert [task.id for task in first["items"]] == ["task-000", "task-002"]
+    assert first["total"] == 3
+    assert dict(first["counts"]) == {"done": 1, "todo": 2}
+    assert first["next_cursor"] == "1:4"
+    assert pages(index, project="alpha", size="L", limit=2) == [
+        ["task-000", "task-002"],
+        ["task-004"],
+    ]
+
+
+def test_status_filter_matches_the_normalized_state():
+    index = RowIndex(make_tasks())
+    page = index.query(status="done")
+    assert [task.id for task in page["items"]] == ["task-000", "task-003", "task-006", "task-009"]
+
+
+def test_cursor_from_another_version_is_stale():
+    cursor = RowIndex(make_tasks(), version=1).query(limit=2)["next_cursor"]
+    with pytest.raises(StaleCursor):
+        RowIndex(make_tasks(), version=2).parse_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", ["abc", "1", "1:x", "-1:2"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        RowIndex(make_tasks(), version=1).parse_cursor(cursor)
+
+
+def test_empty_cursor_starts_at_the_first_row():
+    assert RowIndex(make_tasks()).parse_cursor(None) == 0
+    assert RowIndex(make_tasks()).parse_cursor("") == 0
@@ -0,0 +1,121 @@
+"""ETag, 304 and gzip negotiation, in the helpers and against a running server."""
+
+import gzip
+import json
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from bench.generate import generate_tree
+from snapshot import accepts_gzip, coding_etag, etag_matches
+
+SERVER = Path(__file__).resolve().parent.parent / "server.py"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("gzip", True),
+        ("br, GZIP", True),
+        ("gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("deflate, br", False),
+        # An explicit gzip entry takes precedence over the wildcard
+        ("gzip, *;q=0", True),
+        ("*;q=0, gzip", True),
+        ("gzip;q=0, *", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"old", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abc-gz"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_codings_have_distinct_etags():
+    assert coding_etag('"abc"', gzip=False) == '"abc"'
+    assert coding_etag('"abc"', gzip=True) == '"abc-gz"'
+
+
+def get(base: str, path: str, headers: dict[str, str] | None = None):
+    request = urllib.request.Request(base + path, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    root = tmp_path_factory.mktemp("tree")
+    generate_tree(root, projects=2, epics=2, tasks=3)
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    process = subprocess.Popen(
+        [
+            sys.executable, str(SERVER), "--dir", str(root), "--port", str(port),
+            "--no-snapshot", "--no-history",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                get(base, "/api/projects")
+                break
+            except OSError:
+                time.sleep(0.1)
+        yield base
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def test_data_is_gzipped_only_when_accepted(server):
+    status, headers, body = get(server, "/api/data")
+    assert status == 200
+    assert headers["Content-Encoding"] is None
+    data = json.loads(body)
+
+    status, gz_headers, gz_body = get(server, "/api/data", {"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert gz_headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(gz_body)) == data
+    assert gz_headers["ETag"] == coding_etag(headers["ETag"], gzip=True)
+
+
+def test_matching_etag_gets_304_per_coding(server):
+    _, headers, _ = get(server, "/api/data")
+    etag = headers["ETag"]
+    gz_etag = coding_etag(etag, gzip=True)
+
+    status, _, body = get(server, "/api/data", {"If-None-Match": etag})
+    assert (status, body) == (304, b"")
+    status, _, body = get(
+        server, "/api/data", {"If-None-Match": gz_etag, "Accept-Encoding": "gzip"}
+    )
+    assert (status, body) == (304, b"")
+    # A cached gzip body does not satisfy a client that cannot decode it
+    status, _, _ = get(server, "/api/data", {"If-None-Match": gz_etag})
+    assert status == 200
@@ -0,0 +1,131 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = []
+# ///
+"""
+Hook Latency Benchmark
+
+Times one invocation of each per-tool-call hook, as Claude Code runs it, in
+three ways: the original shell script, hook.sh talking to a serving
+runner.py, and a one-shot `runner.py run` (what hook.sh falls back to when
+no runner is up). Everything runs under a temporary HOME, so the real
+command log is not touched.
+
+Usage:
+    python3 hooks/scripts/bench.py
+    python3 hooks/scripts/bench.py -n 500 --output hooks.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+RUNNER_START_TIMEOUT = 10  # seconds
+
+# (hook, argument) pairs run by every variant
+CASES = [
+    ("log-command", json.dumps({"command": "git status --porcelain"})),
+    ("log-command", json.dumps({"command": "rm -rf /tmp/build"})),
+    ("check-file-protection", json.dumps({"file_path": "src/app.py"})),
+    ("check-file-protection", json.dumps({"file_path": "config/.env.local"})),
+    ("validate-prompt", "Refactor the parser and add tests for the new cases"),
+]
+
+VARIANTS = {
+    "shell": lambda hook, arg: [str(SCRIPTS_DIR / f"{hook}.sh"), arg],
+    "hook.sh": lambda hook, arg: [str(SCRIPTS_DIR / "hook.sh"), hook, arg],
+    "runner run": lambda hook, arg: [
+        sys.executable, "-I", str(SCRIPTS_DIR / "runner.py"), "run", hook, arg
+    ],
+}
+
+
+def summarize(samples: list[float]) -> dict:
+    """Median and p95 latency in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "samples": len(ordered),
+    }
+
+
+def time_command(args: list[str], env: dict, cwd: str, repeat: int) -> tuple[list[float], int]:
+    """Run a command ``repeat`` times; return durations and its last exit code."""
+    durations = []
+    code = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        code = subprocess.run(args, env=env, cwd=cwd, stdout=subprocess.DEVNULL).returncode
+        durations.append(time.perf_counter() - start)
+    return durations, code
+
+
+def start_runner(env: dict, home: Path) -> subprocess.Popen:
+    """Start a serving runner.py and wait until it has published its port."""
+    state = home / ".claude" / "run" / "hook-runner"
+    runner = subprocess.Popen(
+        [sys.executable, "-I", str(SCRIPTS_DIR / "runner.py"), "serve"],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + RUNNER_START_TIMEOUT
+    while not state.exists():
+        if time.monotonic() > deadline or runner.poll() is not None:
+            runner.kill()
+            raise RuntimeError("hook runner did not start")
+        time.sleep(0.05)
+    return runner
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-call hook latency")
+    parser.add_argument("-n", "--repeat", type=int, default=200, help="Runs per case (default: 200)")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp)
+        cwd = str(home)
+        env = {**os.environ, "HOME": str(home)}
+        runner = start_runner(env, home)
+        try:
+            for hook, arg in CASES:
+                label = f"{hook} {arg[:40]}"
+                results[label] = {}
+                codes = set()
+                for variant, command in VARIANTS.items():
+                    # One untimed run warms the page cache and the runner
+                    time_command(command(hook, arg), env, cwd, 1)
+                    durations, code = time_command(command(hook, arg), env, cwd, args.repeat)
+                    results[label][variant] = {**summarize(durations), "exit_code": code}
+                    codes.add(code)
+                if len(codes) > 1:
+                    print(f"Warning: variants disagree on the exit code of {label}")
+        finally:
+            runner.terminate()
+            runner.wait()
+
+    print(f"{'case':<58} {'variant':<11} {'median ms':>10} {'p95 ms':>8}")
+    for label, variants in results.items():
+        for variant, summary in variants.items():
+            print(
+                f"{label:<58} {variant:<11} "
+                f"{summary['median_ms']:>10.2f} {summary['p95_ms']:>8.2f}"
+            )
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/bin/bash
+# hook.sh
+# Runs a hook in the persistent hook runner (runner.py serve)
+#
+# Usage: hook.sh <hook> [argument]
+# Talks to the runner over bash's /dev/tcp, so a call forks nothing. If no
+# runner is up, the hook runs once in a fresh runner.py and a serving one is
+# started for the calls that follow. Where python3 is not installed, the
+# per-hook shell scripts next to this one run instead.
+
+HOOK="$1"
+INPUT="$2"
+STATE_FILE="${HOME}/.claude/run/hook-runner"
+RUNNER="${0%/*}/runner.py"
+# Seconds to wait for the runner's greeting and for it to accept a request.
+# The hook's own run time is not limited here: format-on-save may run a slow
+# formatter, and Claude Code enforces the hook timeout.
+GREETING_TIMEOUT=2
+ACCEPT_TIMEOUT=2
+
+# The runner greets with its server token before we send anything, so a
+# process that took over a crashed runner's port never sees the request
+if read -r PORT TOKEN SERVER_TOKEN 2>/dev/null < "$STATE_FILE" &&
+    { exec 3<>"/dev/tcp/127.0.0.1/${PORT}"; } 2>/dev/null &&
+    IFS= read -r -t "$GREETING_TIMEOUT" GREETING <&3 &&
+    [ -n "$SERVER_TOKEN" ] && [ "$GREETING" = "$SERVER_TOKEN" ]; then
+    # One runner serves every session, so each request carries this
+    # session's environment (FORWARDED_ENV in runner.py) for the hook to run
+    # with. ${!CLAUDE_*} lists the set CLAUDE_* variables without forking.
+    {
+        printf '%s %s\n%s\n' "$TOKEN" "$HOOK" "$PWD"
+        for NAME in PATH VIRTUAL_ENV CONDA_PREFIX LANG LC_ALL DISPLAY WAYLAND_DISPLAY \
+            DBUS_SESSION_BUS_ADDRESS ${!CLAUDE_*}; do
+            [ -n "${!NAME+set}" ] && printf '%s=%s\0' "$NAME" "${!NAME}"
+        done
+        printf '\0%s\0' "$INPUT"
+    } >&3
+    # A runner that does not accept the request in time is treated as gone
+    if IFS= read -r -t "$ACCEPT_TIMEOUT" ACCEPTED <&3 && [ "$ACCEPTED" = accepted ]; then
+        if IFS=' ' read -r CODE STREAM <&3 && [[ "$CODE" =~ ^[0-9]+$ ]]; then
+            # "<code> stderr": the hook failed and the rest is its error
+            [ "$STREAM" = stderr ] && exec 1>&2
+            while IFS= read -r LINE || [ -n "$LINE" ]; do
+                printf '%s\n' "$LINE"
+            done <&3
+            exit "$CODE"
+        fi
+        # The runner died while running the hook, which may already have had
+        # its effect (e.g. a logged command), so it is not run again here
+        echo "hook.sh: the hook runner exited while running $HOOK" >&2
+        exit 2
+    fi
+fi
+exec 3<&-
+
+# Without python3 the hook runs as its original shell script, kept for this
+if ! command -v python3 >/dev/null; then
+    case "$HOOK" in
+        check-file-protection | log-command | format-on-save | notify | on-complete | \
+            validate-environment | validate-prompt)
+            exec "${0%/*}/${HOOK}.sh" "$INPUT"
+            ;;
+    esac
+    echo "hook.sh: unknown hook: $HOOK" >&2
+    exit 2
+fi
+
+# No runner answered or accepted the request: start one in the background and
+# run this hook directly.
+# -I keeps the project's files and PYTHON* variables off sys.path.
+python3 -I "$RUNNER" serve </dev/null >/dev/null 2>&1 &
+disown
+exec python3 -I "$RUNNER" run "$HOOK" "$INPUT"
@@ -0,0 +1,680 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = []
+# ///
+"""
+Hook runner: every hook in hooks.json, in one Python process.
+
+hook.sh forwards each hook call to a runner started with ``serve``, which
+stays up between tool calls so no interpreter, bash, grep or date is
+started per call. Without a running runner, hook.sh uses ``run`` once and
+starts one for the next call.
+
+Usage:
+    python3 runner.py run check-file-protection '{"file_path": "src/app.py"}'
+    python3 runner.py serve
+    python3 runner.py log tail -n 50
+    python3 runner.py log query 'git push' --since 2026-01-01
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from fnmatch import translate
+
+LOG_DIR = os.path.join(os.path.expanduser("~"), ".claude", "logs")
+COMMAND_LOG = os.path.join(LOG_DIR, "command-history.log")
+# Where a serving runner publishes its port and tokens (mode 0600)
+STATE_DIR = os.path.join(os.path.expanduser("~"), ".claude", "run")
+STATE_FILE = os.path.join(STATE_DIR, "hook-runner")
+LOCK_FILE = os.path.join(STATE_DIR, "hook-runner.lock")
+
+MAX_LOG_BYTES = 5 * 1024 * 1024  # command-history.log size that triggers rotation
+LOG_BACKUPS = 5  # rotated files kept: command-history.log.1 .. .5
+IDLE_CHECK_INTERVAL = 5.0  # seconds between the serving runner's idle checks
+IDLE_TIMEOUT = 30 * 60  # seconds without a hook call before the runner exits
+# Seconds a client may stall on the socket before its handler thread gives up
+# (a slow hook is not bounded by this)
+REQUEST_TIMEOUT = 10
+SESSION_LOG_MAX_AGE = 31 * 24 * 3600  # as `find -mtime +30`
+TAIL_BLOCK = 8192
+MAX_PROMPT_LENGTH = 100000
+HOOK_ERROR = 2  # exit code of a hook that raised
+
+# Variables hook.sh sends with every request, so one serving runner runs each
+# session's hooks with that session's PATH, venv and locale. Keep in sync
+# with hook.sh.
+FORWARDED_ENV = (
+    "PATH",
+    "VIRTUAL_ENV",
+    "CONDA_PREFIX",
+    "LANG",
+    "LC_ALL",
+    "DISPLAY",
+    "WAYLAND_DISPLAY",
+    "DBUS_SESSION_BUS_ADDRESS",
+)
+FORWARDED_ENV_PREFIX = "CLAUDE_"
+
+PROTECTED_PATTERNS = (
+    ".env",
+    ".env.*",
+    "*.pem",
+    "*.key",
+    "*credentials*",
+    "*secrets*",
+    ".git/config",
+    ".ssh/*",
+    "node_modules/*",
+    ".venv/*",
+    "__pycache__/*",
+)
+
+# Matched as plain substrings of the command
+DANGEROUS_PATTERNS = (
+    "rm -rf /",
+    "rm -rf ~",
+    "rm -rf $HOME",
+    "> /dev/sda",
+    "mkfs",
+    "dd if=",
+    ":(){:|:&};:",
+    "chmod -R 777 /",
+    "curl.*|.*sh",
+    "wget.*|.*sh",
+)
+
+# Matched case-insensitively as plain substrings of the prompt
+SUSPICIOUS_PATTERNS = (
+    "ignore previous instructions",
+    "ignore all previous",
+    "disregard previous",
+    "forget everything",
+    "you are now",
+    "pretend you are",
+    "act as if",
+    "new persona",
+    "jailbreak",
+    "DAN mode",
+)
+
+# Compiled once; the globs match the whole path with * crossing "/", as
+# bash's [[ $path == $pattern ]] does
+PROTECTED = re.compile("|".join(translate(pattern) for pattern in PROTECTED_PATTERNS))
+DANGEROUS = re.compile("|".join(re.escape(pattern) for pattern in DANGEROUS_PATTERNS))
+SUSPICIOUS = re.compile(
+    "|".join(re.escape(pattern) for pattern in SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+SENSITIVE_CONTENT = re.compile(rb"(password|secret|api_key|private_key)\s*=")
+ENCODED_CONTENT = re.compile(r"base64|\\x[0-9a-fA-F]{2}|%[0-9a-fA-F]{2}")
+
+# File extension -> formatters to try, first one installed wins
+FORMATTERS = {
+    "py": (("ruff", "format", "{path}", "--quiet"), ("black", "{path}", "--quiet")),
+    **{
+        ext: (("prettier", "--write", "{path}", "--log-level", "error"),)
+        for ext in ("js", "jsx", "ts", "tsx", "json", "css", "scss", "md", "yaml", "yml")
+    },
+    "go": (("gofmt", "-w", "{path}"),),
+    "rs": (("rustfmt", "{path}"),),
+}
+
+HookResult = tuple[int, str]
+
+
+def utc_timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def which(name: str, env: dict[str, str]) -> str | None:
+    """Find an executable on env's PATH (shutil.which without the import cost)."""
+    for directory in env.get("PATH", "").split(os.pathsep):
+        candidate = os.path.join(directory, name)
+        if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def is_forwarded(name: str) -> bool:
+    return name in FORWARDED_ENV or name.startswith(FORWARDED_ENV_PREFIX)
+
+
+def caller_env(forwarded: dict[str, str]) -> dict[str, str]:
+    """Return the environment to run a forwarded hook call with.
+
+    That is the runner's own environment with every forwarded variable taken
+    from the caller instead, so one the caller does not set is unset too.
+    """
+    env = {name: value for name, value in os.environ.items() if not is_forwarded(name)}
+    env.update(forwarded)
+    return env
+
+
+def tool_field(tool_input: str, name: str) -> str | None:
+    """Return a string field of the tool-input JSON, or None if absent or not JSON.
+
+    Accepts the tool input itself or a hook payload wrapping it in "tool_input".
+    """
+    try:
+        payload = json.loads(tool_input)
+    except ValueError:
+        return None
+    if isinstance(payload, dict) and isinstance(payload.get("tool_input"), dict):
+        payload = payload["tool_input"]
+    value = payload.get(name) if isinstance(payload, dict) else None
+    return value if isinstance(value, str) else None
+
+
+class AuditLog:
+    """Append-only log with one record per line, rotated by size.
+
+    Records queued by concurrent hook calls are written with one append per
+    flush. When a write would take the file past ``max_bytes`` it is renamed
+    to .1 first, shifting older backups up to ``backups``. Writers in other
+    processes are serialized with flock.
+    """
+
+    def __init__(self, path: str, max_bytes: int = MAX_LOG_BYTES, backups: int = LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffer: list[str] = []
+        self.lock = threading.Lock()
+
+    def append(self, record: str) -> None:
+        # Newlines inside a record are escaped so every record is one line
+        record = record.replace("\\", "\\\\").replace("\n", "\\n")
+        with self.lock:
+            self.buffer.append(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            records, self.buffer = self.buffer, []
+        if not records:
+            return
+        data = ("\n".join(records) + "\n").encode("utf-8", "replace")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        while True:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                lock(fd)
+                # Another process may have rotated the file while we waited
+                try:
+                    current = os.stat(self.path).st_ino == os.fstat(fd).st_ino
+                except FileNotFoundError:
+                    current = False
+                if not current:
+                    continue
+                size = os.fstat(fd).st_size
+                if size and size + len(data) > self.max_bytes:
+                    self.rotate()
+                    continue
+                os.write(fd, data)
+                return
+            finally:
+                os.close(fd)
+
+    def rotate(self) -> None:
+        for i in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def files(self) -> list[str]:
+        """Existing log files, oldest first."""
+        paths = [f"{self.path}.{i}" for i in range(self.backups, 0, -1)] + [self.path]
+        return [path for path in paths if os.path.exists(path)]
+
+    def tail(self, count: int) -> list[str]:
+        """Return the last ``count`` records, reading the files backwards."""
+        lines: list[str] = []
+        for path in reversed(self.files()):
+            lines = read_last_lines(path, count - len(lines)) + lines
+            if len(lines) >= count:
+                break
+        return lines
+
+    def query(
+        self, pattern: re.Pattern | None, since: str | None = None, limit: int = 100
+    ) -> list[str]:
+        """Return the last ``limit`` records matching pattern, logged at or after since.
+
+        ``since`` is an ISO 8601 UTC prefix ("2026-01-31", "2026-01-31T12:00");
+        rotated files last modified before it are skipped unread.
+        """
+        from collections import deque
+
+        matches: deque[str] = deque(maxlen=limit)
+        for path in self.files():
+            if since and utc_iso(os.stat(path).st_mtime) < since:
+                continue
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if since and line[1:21] < since:
+                        continue
+                    if pattern is None or pattern.search(line):
+                        matches.append(line.rstrip("\n"))
+        return list(matches)
+
+
+def utc_iso(seconds: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def read_last_lines(path: str, count: int) -> list[str]:
+    """Read the last ``count`` lines of a file by seeking back from its end."""
+    if count <= 0:
+        return []
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(TAIL_BLOCK, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    return data.decode("utf-8", "replace").splitlines()[-count:]
+
+
+def lock(fd: int) -> None:
+    try:
+        import fcntl
+    except ImportError:  # Windows: no advisory locks, appends still land whole
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+AUDIT_LOG = AuditLog(COMMAND_LOG)
+
+
+# Hooks: each takes its hook.sh argument and the caller's working directory
+# and environment and returns (exit code, output), matching the scripts they
+# replace.
+
+
+def check_file_protection(tool_input: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Block edits to protected files; warn about files holding secrets."""
+    path = tool_field(tool_input, "file_path")
+    if not path:
+        return 0, ""
+    if PROTECTED.match(path):
+        return 1, f"BLOCKED: Cannot modify protected file: {path}\n"
+    try:
+        with open(os.path.join(cwd, path), "rb") as f:
+            if any(SENSITIVE_CONTENT.search(line) for line in f):
+                return 0, "WARNING: File contains sensitive patterns. Proceeding with caution.\n"
+    except OSError:
+        pass
+    return 0, ""
+
+
+def log_command(tool_input: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Record a Bash command in the audit log; block dangerous ones."""
+    command = tool_field(tool_input, "command")
+    if command is None:
+        command = tool_input
+    AUDIT_LOG.append(f"[{utc_timestamp()}] {command}")
+    # Written before replying, so a runner killed afterwards loses nothing
+    AUDIT_LOG.flush()
+    if DANGEROUS.search(command):
+        pattern = next(pattern for pattern in DANGEROUS_PATTERNS if pattern in command)
+        return 1, f"BLOCKED: Dangerous command pattern detected: {pattern}\n"
+    return 0, ""
+
+
+def format_on_save(tool_input: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Run the first installed formatter for the edited file's type."""
+    path = tool_field(tool_input, "file_path")
+    if not path or not os.path.isfile(os.path.join(cwd, path)):
+        return 0, ""
+    for formatter in FORMATTERS.get(path.rpartition(".")[2], ()):
+        executable = which(formatter[0], env)
+        if executable is None:
+            continue
+        import subprocess
+
+        args = [executable] + [arg.format(path=path) for arg in formatter[1:]]
+        result = subprocess.run(
+            args, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        return 0, result.stdout
+    return 0, ""
+
+
+def notify(event: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Show a desktop notification for error, completion and warning events."""
+    if "error" in event:
+        title, message = "Claude Code Error", "An error occurred during execution"
+    elif "complete" in event:
+        title, message = "Claude Code", "Task completed successfully"
+    elif "warning" in event:
+        title, message = "Claude Code Warning", "A warning was generated"
+    else:
+        return 0, ""
+    import subprocess
+
+    if which("osascript", env):
+        args = ["osascript", "-e", f'display notification "{message}" with title "{title}"']
+    elif which("notify-send", env):
+        args = ["notify-send", title, message]
+    elif which("powershell.exe", env):
+        args = [
+            "powershell.exe",
+            "-Command",
+            "[Windows.UI.Notifications.ToastNotificationManager, Windows.UI.Notifications, "
+            "ContentType = WindowsRuntime] | Out-Null; $template = "
+            "[Windows.UI.Notifications.ToastNotificationManager]::GetTemplateContent("
+            "[Windows.UI.Notifications.ToastTemplateType]::ToastText02); "
+            f"$template.GetElementsByTagName('text')[0].AppendChild($template.CreateTextNode('{title}')); "
+            f"$template.GetElementsByTagName('text')[1].AppendChild($template.CreateTextNode('{message}'))",
+        ]
+    else:
+        return 0, ""
+    result = subprocess.run(args, env=env, stdout=subprocess.PIPE, text=True)
+    return 0, result.stdout
+
+
+def on_complete(_: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Log the session's completion and delete logs older than 30 days."""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    session_log = os.path.join(LOG_DIR, f"session-{time.strftime('%Y%m%d')}.log")
+    with open(session_log, "a", encoding="utf-8") as f:
+        f.write(f"[{utc_timestamp()}] Session completed\n")
+    cutoff = time.time() - SESSION_LOG_MAX_AGE
+    for directory, _, names in os.walk(LOG_DIR):
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                if name.endswith(".log") and os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+    return 0, ""
+
+
+def validate_environment(_: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Report installed tools, git state and .env files at session start."""
+    import subprocess
+
+    def run(*args: str) -> str:
+        try:
+            result = subprocess.run(
+                args,
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            return ""
+        return result.stdout
+
+    out = ["Validating development environment..."]
+    errors = warnings = 0
+    for tool, required in (
+        ("git", True),
+        ("python", False),
+        ("uv", False),
+        ("ruff", False),
+        ("node", False),
+        ("pnpm", False),
+    ):
+        if which(tool, env):
+            version = (run(tool, "--version").splitlines() or [""])[0]
+            out.append(f"✓ {tool}: {version}")
+        elif required:
+            out.append(f"✗ {tool}: NOT FOUND (required)")
+            errors += 1
+        else:
+            out.append(f"⚠ {tool}: not found (optional)")
+            warnings += 1
+
+    if os.path.isdir(os.path.join(cwd, ".git")):
+        status = run("git", "status", "--porcelain")
+        out += [
+            "",
+            "Git repository detected:",
+            f"  Branch: {run('git', 'branch', '--show-current').strip()}",
+            f"  Status: {len(status.splitlines())} uncommitted changes",
+        ]
+        if re.search(r"\.env|credentials|secrets", status):
+            out.append("⚠ WARNING: Sensitive files detected in uncommitted changes")
+            warnings += 1
+
+    if os.path.isfile(os.path.join(cwd, ".env")):
+        out += ["", "✓ Environment file (.env) found"]
+    elif os.path.isfile(os.path.join(cwd, ".env.example")):
+        out += [
+            "",
+            "⚠ No .env file found, but .env.example exists",
+            "  Consider copying: cp .env.example .env",
+        ]
+        warnings += 1
+
+    out += ["", "Environment validation complete:", f"  Errors: {errors}", f"  Warnings: {warnings}"]
+    if errors:
+        out += ["", "Environment has errors. Some features may not work correctly."]
+    return (1 if errors else 0), "\n".join(out) + "\n"
+
+
+def validate_prompt(prompt: str, cwd: str, env: dict[str, str]) -> HookResult:
+    """Warn about prompt-injection phrases, very long prompts and encoded content."""
+    out = []
+    if SUSPICIOUS.search(prompt):
+        lowered = prompt.lower()
+        for pattern in SUSPICIOUS_PATTERNS:
+            if pattern.lower() in lowered:
+                out.append(f"WARNING: Suspicious prompt pattern detected: '{pattern}'")
+    if len(prompt) > MAX_PROMPT_LENGTH:
+        out.append(f"WARNING: Prompt is unusually long ({len(prompt)} characters)")
+    if ENCODED_CONTENT.search(prompt):
+        out.append("NOTE: Prompt contains encoded content")
+    return 0, "".join(line + "\n" for line in out)
+
+
+HOOKS = {
+    "check-file-protection": check_file_protection,
+    "log-command": log_command,
+    "format-on-save": format_on_save,
+    "notify": notify,
+    "on-complete": on_complete,
+    "validate-environment": validate_environment,
+    "validate-prompt": validate_prompt,
+}
+
+
+def run_hook(name: str, argument: str, cwd: str, env: dict[str, str]) -> HookResult:
+    hook = HOOKS.get(name)
+    if hook is None:
+        return 2, f"Unknown hook: {name}\n"
+    return hook(argument, cwd, env)
+
+
+def read_env_and_argument(rfile) -> tuple[dict[str, str], str] | None:
+    """Read the NUL-terminated part of a request: the caller's forwarded
+    variables as "NAME=value" fields, an empty field, then the argument.
+
+    Returns None if the connection ends first.
+    """
+    data = b""
+    while True:
+        # Every field but the last is complete
+        fields = data.split(b"\0")[:-1]
+        if b"" in fields and fields.index(b"") < len(fields) - 1:
+            break
+        chunk = rfile.read1(65536)
+        if not chunk:
+            return None
+        data += chunk
+    end = fields.index(b"")
+    env = {}
+    for entry in fields[:end]:
+        name, _, value = entry.decode("utf-8", "replace").partition("=")
+        if is_forwarded(name):
+            env[name] = value
+    return env, fields[end + 1].decode("utf-8", "replace")
+
+
+def serve(idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """Answer hook.sh requests on a localhost port until idle for idle_timeout.
+
+    On connect the runner sends its server token, so hook.sh can tell it from
+    whatever took over the port of a crashed runner before sending anything.
+    A request is "<client token> <hook>\\n<cwd>\\n", the caller's forwarded
+    variables as "NAME=value\\0" fields, "\\0", then "<argument>\\0"; the hook
+    runs with those variables (see caller_env). The runner answers
+    "accepted\\n" before running the hook, then the exit code on one line
+    followed by the hook's output. If the hook raised, that line is
+    "<code> stderr" and the error follows, for hook.sh to print on stderr.
+    Only one runner serves at a time; a second one exits at once.
+    """
+    import fcntl
+    import hmac
+    import secrets
+    import socketserver
+
+    os.makedirs(STATE_DIR, mode=0o700, exist_ok=True)
+    lock_fd = os.open(LOCK_FILE, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return  # Another runner is serving
+    if hasattr(os, "setsid"):
+        try:
+            os.setsid()  # Outlive the hook that started us
+        except OSError:
+            pass
+
+    token = secrets.token_hex(16)
+    # Sent to anyone who connects, so it proves nothing about the client
+    server_token = secrets.token_hex(16)
+    last_request = [time.monotonic()]
+
+    class Handler(socketserver.StreamRequestHandler):
+        timeout = REQUEST_TIMEOUT
+
+        def handle(self):
+            try:
+                self.wfile.write(f"{server_token}\n".encode("ascii"))
+                header = self.rfile.readline(1024).decode("utf-8", "replace").split()
+                if len(header) != 2 or not hmac.compare_digest(header[0], token):
+                    return
+                cwd = self.rfile.readline(65536).decode("utf-8", "replace").rstrip("\n")
+                request = read_env_and_argument(self.rfile)
+            except OSError:  # Timed out or disconnected
+                return
+            if request is None:
+                return
+            forwarded, argument = request
+            last_request[0] = time.monotonic()
+            try:
+                # From here on hook.sh waits for the hook however long it takes
+                self.wfile.write(b"accepted\n")
+            except OSError:
+                return
+            try:
+                code, output = run_hook(
+                    header[1], argument, cwd or os.getcwd(), caller_env(forwarded)
+                )
+                status = f"{code}"
+            except Exception as e:
+                # Fail closed: a broken protection hook must not let the call through
+                status = f"{HOOK_ERROR} stderr"
+                output = f"hook runner: {header[1]} failed: {e}\n"
+            self.wfile.write(f"{status}\n{output}".encode("utf-8"))
+
+    class Server(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port = server.server_address[1]
+    tmp = STATE_FILE + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(f"{port} {token} {server_token}\n")
+    os.replace(tmp, STATE_FILE)
+
+    def housekeeping():
+        while True:
+            time.sleep(IDLE_CHECK_INTERVAL)
+            if time.monotonic() - last_request[0] > idle_timeout:
+                server.shutdown()
+                return
+
+    threading.Thread(target=housekeeping, daemon=True).start()
+    try:
+        server.serve_forever()
+    finally:
+        AUDIT_LOG.flush()
+        try:
+            with open(STATE_FILE) as f:
+                published = f.read().split()
+            if published[1:] == [token, server_token]:
+                os.remove(STATE_FILE)
+        except (OSError, IndexError):
+            pass
+        server.server_close()
+
+
+def log_main(argv: list[str]) -> int:
+    """The ``log`` subcommand: tail or query the command audit log."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="runner.py log", description=log_main.__doc__)
+    commands = parser.add_subparsers(dest="action", required=True)
+    tail = commands.add_parser("tail", help="Print the most recent commands")
+    tail.add_argument("-n", type=int, default=20, help="Number of records (default: 20)")
+    query = commands.add_parser("query", help="Print the latest commands matching a regex")
+    query.add_argument("pattern", nargs="?", help="Regular expression to search for")
+    query.add_argument("--since", help="Only records at or after this UTC time (ISO 8601)")
+    query.add_argument("-n", type=int, default=100, help="Maximum records (default: 100)")
+    query.add_argument("-i", action="store_true", help="Ignore case")
+    args = parser.parse_args(argv)
+
+    if args.action == "tail":
+        records = AUDIT_LOG.tail(args.n)
+    else:
+        pattern = re.compile(args.pattern, re.IGNORECASE if args.i else 0) if args.pattern else None
+        records = AUDIT_LOG.query(pattern, args.since, args.n)
+    for record in records:
+        print(record)
+    return 0
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        return 2
+    command = sys.argv[1]
+    if command == "run" and len(sys.argv) >= 3:
+        try:
+            code, output = run_hook(
+                sys.argv[2],
+                sys.argv[3] if len(sys.argv) > 3 else "",
+                os.getcwd(),
+                dict(os.environ),
+            )
+        except Exception as e:
+            sys.stderr.write(f"hook runner: {sys.argv[2]} failed: {e}\n")
+            return HOOK_ERROR
+        finally:
+            AUDIT_LOG.flush()
+        sys.stdout.write(output)
+        return code
+    if command == "serve":
+        serve()
+        return 0
+    if command == "log":
+        return log_main(sys.argv[2:])
+    print(__doc__.strip())
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""Make runner.py importable the way hook.sh runs it, as a plain script."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
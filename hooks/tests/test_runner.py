@@ -0,0 +1,159 @@
+"""Exit codes of the hook runner and hook.sh's fallbacks."""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import runner
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+HOOK_SH = SCRIPTS / "hook.sh"
+PROTECTED_INPUT = json.dumps({"file_path": ".env"})
+PLAIN_INPUT = json.dumps({"file_path": "src/app.py"})
+
+
+def test_unknown_hook_fails():
+    code, output = runner.run_hook("no-such-hook", "", ".", {})
+    assert code == 2
+    assert "Unknown hook" in output
+
+
+def test_protected_file_is_blocked():
+    assert runner.run_hook("check-file-protection", PROTECTED_INPUT, ".", {})[0] == 1
+    assert runner.run_hook("check-file-protection", PLAIN_INPUT, ".", {}) == (0, "")
+
+
+def test_hook_that_raises_exits_with_hook_error(monkeypatch, capsys):
+    def broken(argument, cwd, env):
+        raise OSError("disk full")
+
+    monkeypatch.setitem(runner.HOOKS, "broken", broken)
+    monkeypatch.setattr(sys, "argv", ["runner.py", "run", "broken", ""])
+    assert runner.main() == runner.HOOK_ERROR
+    assert "broken failed: disk full" in capsys.readouterr().err
+
+
+@pytest.fixture
+def home(tmp_path):
+    home = tmp_path / "home"
+    home.mkdir()
+    return home
+
+
+def hook(home: Path, name: str, argument: str = "", path: str | None = None):
+    env = {"HOME": str(home), "PATH": path if path is not None else os.environ["PATH"]}
+    return subprocess.run(
+        ["/bin/bash", str(HOOK_SH), name, argument],
+        env=env,
+        cwd=home,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+
+@pytest.fixture
+def no_python(tmp_path) -> str:
+    """A PATH with what check-file-protection.sh needs, but no python3.
+
+    hook.sh then falls back to the shell script rather than starting a runner
+    that would outlive the test.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "grep").symlink_to(shutil.which("grep"))
+    return str(bin_dir)
+
+
+@pytest.fixture
+def serving(home):
+    """A runner serving hook.sh calls for HOME=home."""
+    state_file = home / ".claude" / "run" / "hook-runner"
+    process = subprocess.Popen(
+        [sys.executable, "-I", str(SCRIPTS / "runner.py"), "serve"],
+        env={"HOME": str(home), "PATH": os.environ["PATH"]},
+    )
+    try:
+        for _ in range(100):
+            if state_file.exists():
+                break
+            time.sleep(0.05)
+        yield state_file
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def test_runner_exit_codes_through_hook_sh(home, serving):
+    blocked = hook(home, "check-file-protection", PROTECTED_INPUT)
+    assert blocked.returncode == 1
+    assert blocked.stdout == "BLOCKED: Cannot modify protected file: .env\n"
+    assert hook(home, "check-file-protection", PLAIN_INPUT).returncode == 0
+    assert hook(home, "no-such-hook").returncode == 2
+
+
+def test_hook_error_is_reported_on_stderr(home, serving):
+    # on-complete cannot create its log directory where a file is in the way
+    (home / ".claude" / "logs").write_text("")
+    result = hook(home, "on-complete")
+    assert result.returncode == runner.HOOK_ERROR
+    assert result.stdout == ""
+    assert "on-complete failed" in result.stderr
+
+
+def fake_runner(home: Path, argument: str, accept: bool) -> socket.socket:
+    """Publish a port that greets like a runner, then accepts and dies or hangs."""
+    state_file = home / ".claude" / "run" / "hook-runner"
+    state_file.parent.mkdir(parents=True)
+    listener = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        connection, _ = listener.accept()
+        with connection:
+            connection.sendall(b"server-token\n")
+            request = b""
+            while not request.endswith(f"\0{argument}\0".encode()):
+                request += connection.recv(65536)
+            if accept:
+                connection.sendall(b"accepted\n")
+            else:
+                time.sleep(5)
+
+    threading.Thread(target=serve, daemon=True).start()
+    state_file.write_text(f"{listener.getsockname()[1]} token server-token\n")
+    return listener
+
+
+def test_runner_that_does_not_accept_falls_back(home, no_python):
+    with fake_runner(home, PROTECTED_INPUT, accept=False):
+        started = time.monotonic()
+        result = hook(home, "check-file-protection", PROTECTED_INPUT, path=no_python)
+    assert result.returncode == 1
+    assert result.stdout == "BLOCKED: Cannot modify protected file: .env\n"
+    assert time.monotonic() - started < 5
+
+
+def test_runner_dying_after_accepting_is_not_retried(home, no_python):
+    with fake_runner(home, PROTECTED_INPUT, accept=True):
+        result = hook(home, "check-file-protection", PROTECTED_INPUT, path=no_python)
+    assert result.returncode == 2
+    assert "exited while running check-file-protection" in result.stderr
+
+
+def test_shell_scripts_run_without_python(home, no_python):
+    blocked = hook(home, "check-file-protection", PROTECTED_INPUT, path=no_python)
+    assert blocked.returncode == 1
+    assert blocked.stdout == "BLOCKED: Cannot modify protected file: .env\n"
+    assert hook(home, "check-file-protection", PLAIN_INPUT, path=no_python).returncode == 0
+
+    unknown = hook(home, "no-such-hook", path=no_python)
+    assert unknown.returncode == 2
+    assert "unknown hook" in unknown.stderr